@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Benchmark the sync pipeline on synthetic data at several scales.
+
+For each scale, a synthetic data tree is generated (see synthetic_data.py) and
+cached under .cache/benchmark/, then three stages are timed:
+
+    load       parse the TOML files
+    transform  build node properties and relationship rows, batch by batch
+    write      run Neo4jSyncerOptimized over the records (transform included)
+
+Writes go to a recording stand-in for the Neo4j driver by default, which
+measures everything on our side of the wire. With --neo4j they go to the
+database in NEO4J_URI instead (use a throwaway local instance: the benchmark
+writes and then deletes staged nodes there).
+
+Each scale runs in its own process so peak RSS is measured per scale. The
+report (JSON) has files/sec, rows/sec, peak RSS and latency percentiles of
+each stage's batches or transactions.
+
+Usage:
+    python benchmark.py                                  # Scales 1, 10 and 100, recording driver
+    python benchmark.py --scale 1 --scale 10             # Selected scales
+    python benchmark.py --neo4j --output report.json     # Against a local Neo4j, report to a file
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+from loader import ENTITY_DIRS, STREAM_CHUNK_SIZE, list_entity_files, parse_files, process_pool
+from synthetic_data import GENERATOR_VERSION, generate_tree
+from transform import (
+    chamber_congress_edge, chamber_node, committee_congress_edges, committee_node,
+    congress_node, person_chamber_edges, person_node,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCALES = [1, 10, 100]
+
+DEFAULT_DATA_ROOT = Path(__file__).parent.parent / ".cache" / "benchmark"
+
+# Marks a generated tree as complete (holding the generator version), so an
+# interrupted or outdated generation is redone
+COMPLETE_MARKER = ".complete"
+
+
+class _RecordedSummary:
+    """Result summary of a recorded statement (the server reports no changes)."""
+
+    counters = None
+
+
+class _RecordedResult:
+    """Empty result of a recorded statement."""
+
+    def consume(self) -> _RecordedSummary:
+        return _RecordedSummary()
+
+    def single(self):
+        return None
+
+    def __iter__(self):
+        return iter([])
+
+
+class _RecordingSession:
+    """Session (and transaction) of a RecordingDriver."""
+
+    def __init__(self, driver: "RecordingDriver"):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def run(self, query: str, parameters: dict = None, **kwargs) -> _RecordedResult:
+        params = {**(parameters or {}), **kwargs}
+        # Parameter rows are what UNWIND turns into work on the server
+        rows = sum(len(value) for value in params.values() if isinstance(value, list))
+        with self.driver.lock:
+            self.driver.statements += 1
+            self.driver.parameter_rows += rows
+        return _RecordedResult()
+
+    def execute_write(self, tx_function, *args, **kwargs):
+        return tx_function(self, *args, **kwargs)
+
+    def close(self):
+        pass
+
+
+class RecordingDriver:
+    """Stand-in for a neo4j Driver that counts statements instead of running them."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.statements = 0
+        self.parameter_rows = 0
+
+    def verify_connectivity(self):
+        pass
+
+    def session(self, **kwargs) -> _RecordingSession:
+        return _RecordingSession(self)
+
+    def close(self):
+        pass
+
+
+class _TimedSession:
+    """Session wrapper that times each managed write transaction."""
+
+    def __init__(self, driver: "TimedDriver", session):
+        self._driver = driver
+        self._session = session
+
+    def __enter__(self):
+        self._session.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        return self._session.__exit__(*exc_info)
+
+    def execute_write(self, tx_function, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._session.execute_write(tx_function, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._driver.lock:
+                self._driver.latencies.append(elapsed)
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+
+class TimedDriver:
+    """Driver wrapper recording the latency of every write transaction."""
+
+    def __init__(self, driver):
+        self._driver = driver
+        self.lock = threading.Lock()
+        self.latencies: List[float] = []
+
+    def session(self, **kwargs) -> _TimedSession:
+        return _TimedSession(self, self._driver.session(**kwargs))
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """Nearest-rank p50/p90/p99/max of latencies in seconds, reported in milliseconds."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def rank(p: float) -> float:
+        return ordered[min(len(ordered) - 1, max(0, int(round(p * len(ordered))) - 1))]
+
+    return {
+        "p50": round(rank(0.50) * 1000, 3),
+        "p90": round(rank(0.90) * 1000, 3),
+        "p99": round(rank(0.99) * 1000, 3),
+        "max": round(ordered[-1] * 1000, 3),
+    }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process and its (parse) workers, in MB."""
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    unit = 1024 * 1024 if sys.platform == "darwin" else 1024
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    return round(peak * unit / (1024 * 1024), 1)
+
+
+def _stage_report(seconds: float, rows: int, latencies: List[float], files: int = None) -> dict:
+    report = {"seconds": round(seconds, 3)}
+    if files is not None:
+        report["files"] = files
+        report["files_per_sec"] = round(files / seconds, 1) if seconds else None
+    report["rows"] = rows
+    report["rows_per_sec"] = round(rows / seconds, 1) if seconds else None
+    report["latency_ms"] = percentiles(latencies)
+    report["peak_rss_mb"] = peak_rss_mb()
+    return report
+
+
+def bench_load(data_dir: Path):
+    """Parse every file, a chunk at a time as the sync does; returns (report, records)."""
+    records: Dict[str, List[dict]] = {entity: [] for entity in ENTITY_DIRS}
+    latencies = []
+    files = 0
+    start = time.perf_counter()
+    for entity in ENTITY_DIRS:
+        paths = list_entity_files(data_dir, entity)
+        files += len(paths)
+        with process_pool() as executor:
+            for chunk_start in range(0, len(paths), STREAM_CHUNK_SIZE):
+                chunk_time = time.perf_counter()
+                chunk = paths[chunk_start:chunk_start + STREAM_CHUNK_SIZE]
+                for file_path, data, error in parse_files(chunk, executor=executor):
+                    if error is not None:
+                        logger.error(f"Failed to load {file_path}: {error}")
+                        continue
+                    records[entity].append(data)
+                latencies.append(time.perf_counter() - chunk_time)
+
+    rows = sum(len(entity_records) for entity_records in records.values())
+    return _stage_report(time.perf_counter() - start, rows, latencies, files=files), records
+
+
+def bench_transform(records: Dict[str, List[dict]], batch_sizes: Dict[str, int]) -> dict:
+    """Build node and relationship rows in the sync's batch sizes; one latency per batch."""
+    congress_mapping = {c["congress_number"]: c["id"] for c in records["congress"]}
+    chamber_mapping = {(c.get("congress"), c.get("subtype")): c["id"] for c in records["chamber"]}
+
+    def congress_rows(congress):
+        return [congress_node(congress)]
+
+    def chamber_rows(chamber):
+        edge = chamber_congress_edge(chamber, congress_mapping)
+        return [chamber_node(chamber)] + ([edge] if edge else [])
+
+    def committee_rows(committee):
+        return [committee_node(committee)] + committee_congress_edges(committee, congress_mapping)
+
+    def person_rows(person):
+        return [person_node(person)] + person_chamber_edges(person, chamber_mapping)[0]
+
+    builders = {"congress": congress_rows, "chamber": chamber_rows,
+                "committee": committee_rows, "person": person_rows}
+
+    latencies = []
+    rows = 0
+    start = time.perf_counter()
+    for entity, build in builders.items():
+        entity_records = records[entity]
+        batch_size = batch_sizes[entity]
+        for batch_start in range(0, len(entity_records), batch_size):
+            batch_time = time.perf_counter()
+            for record in entity_records[batch_start:batch_start + batch_size]:
+                rows += len(build(record))
+            latencies.append(time.perf_counter() - batch_time)
+
+    return _stage_report(time.perf_counter() - start, rows, latencies)
+
+
+def bench_write(records: Dict[str, List[dict]], driver, workers: int,
+                batch_sizes: Dict[str, int], use_neo4j: bool) -> dict:
+    """Run the sync over the records; one latency per write transaction."""
+    from sync_to_neo4j import Neo4jSyncerOptimized
+
+    timed_driver = TimedDriver(driver)
+    syncer = Neo4jSyncerOptimized(None, None, None, workers=workers, batch_sizes=batch_sizes,
+                                  driver=timed_driver)
+    try:
+        if use_neo4j:
+            # Write under staged labels so a live graph in the database is untouched
+            syncer.create_indexes()
+            syncer.clear_staging()
+            syncer.use_staging()
+            timed_driver.latencies.clear()
+
+        start = time.perf_counter()
+        congress_mapping = syncer.sync_congresses_batch(records["congress"])
+        chamber_mapping = syncer.sync_chambers_batch(records["chamber"], congress_mapping)
+        syncer.sync_committees_batch(records["committee"], congress_mapping)
+        syncer.sync_people_batch(records["person"], chamber_mapping)
+        seconds = time.perf_counter() - start
+
+        report = _stage_report(seconds, sum(syncer.expected.values()), timed_driver.latencies)
+        report["transactions"] = len(timed_driver.latencies)
+        report["failed_batches"] = len(syncer.writer.failures)
+        if isinstance(driver, RecordingDriver):
+            report["statements"] = driver.statements
+            report["parameter_rows"] = driver.parameter_rows
+
+        if use_neo4j:
+            syncer.clear_staging()
+        return report
+    finally:
+        syncer.close()
+
+
+def run_scale(data_dir: Path, workers: int, use_neo4j: bool) -> dict:
+    """Benchmark every stage on one data tree (in this process)."""
+    from sync_to_neo4j import DEFAULT_BATCH_SIZES
+
+    # Keep per-batch progress logging out of the timings
+    logging.getLogger("sync_to_neo4j").setLevel(logging.WARNING)
+
+    if use_neo4j:
+        from dotenv import load_dotenv
+        from neo4j import GraphDatabase
+
+        load_dotenv()
+        driver = GraphDatabase.driver(
+            os.environ["NEO4J_URI"],
+            auth=(os.environ["NEO4J_USERNAME"], os.environ["NEO4J_PASSWORD"]),
+        )
+    else:
+        driver = RecordingDriver()
+
+    load_report, records = bench_load(data_dir)
+    return {
+        "load": load_report,
+        "transform": bench_transform(records, DEFAULT_BATCH_SIZES),
+        "write": bench_write(records, driver, workers, DEFAULT_BATCH_SIZES, use_neo4j),
+    }
+
+
+def ensure_tree(data_root: Path, scale: int) -> Path:
+    """Generate the synthetic tree for a scale unless it is already cached."""
+    data_dir = data_root / f"scale-{scale}"
+    marker = data_dir / COMPLETE_MARKER
+    if marker.exists() and marker.read_text().strip() == str(GENERATOR_VERSION):
+        return data_dir
+    if data_dir.exists():
+        shutil.rmtree(data_dir)
+
+    logger.info(f"Generating synthetic data at scale {scale} in {data_dir}")
+    start = time.time()
+    counts = generate_tree(data_dir, scale=scale)
+    marker.write_text(f"{GENERATOR_VERSION}\n")
+    logger.info(f"Generated {sum(counts.values())} files in {time.time() - start:.1f}s")
+    return data_dir
+
+
+def main():
+    """Run the benchmark and write the JSON report."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    parser = argparse.ArgumentParser(description="Benchmark the sync pipeline on synthetic data.")
+    parser.add_argument("--scale", type=int, action="append", dest="scales",
+                        help=f"Scale to run (repeatable; default: {' '.join(map(str, DEFAULT_SCALES))})")
+    parser.add_argument("--neo4j", action="store_true",
+                        help="Write to the Neo4j in NEO4J_URI instead of the recording driver")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent write transactions (default: 4)")
+    parser.add_argument("--data-root", type=Path, default=DEFAULT_DATA_ROOT,
+                        help="Where synthetic trees are generated and cached")
+    parser.add_argument("--output", type=Path, help="Write the report here instead of stdout")
+    parser.add_argument("--run-dir", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Child process: benchmark one tree and print its report
+    if args.run_dir:
+        json.dump(run_scale(args.run_dir, args.workers, args.neo4j), sys.stdout)
+        return
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "driver": "neo4j" if args.neo4j else "recording",
+        "workers": args.workers,
+        "scales": {},
+    }
+    for scale in args.scales or DEFAULT_SCALES:
+        data_dir = ensure_tree(args.data_root, scale)
+        logger.info(f"Benchmarking scale {scale}...")
+        command = [sys.executable, __file__, "--run-dir", str(data_dir), "--workers", str(args.workers)]
+        if args.neo4j:
+            command.append("--neo4j")
+        result = subprocess.run(command, stdout=subprocess.PIPE, text=True)
+        if result.returncode != 0:
+            logger.error(f"Benchmark at scale {scale} failed")
+            sys.exit(1)
+        report["scales"][f"{scale}x"] = json.loads(result.stdout)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+        logger.info(f"Wrote report to {args.output}")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
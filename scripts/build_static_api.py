@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Render the dataset into a static JSON API that can be served from a CDN.
+
+Shards:
+    congress/<n>/senate.json   Senate roster of congress n
+    congress/<n>/house.json    House roster of congress n
+    person/<ulid>.json         A person's profile and chamber memberships
+    committee/<n>.json         Committees of congress n
+
+Each shard is written under a content-hashed name (e.g.
+`person/<ulid>.<hash>.json`, cacheable forever) with precompressed `.gz` and
+`.br` siblings. `manifest.json` maps every shard's logical path to its current
+file, hash and size.
+
+Rebuilds are incremental: all shards are rendered in memory (cheap), but only
+shards whose content changed since the last manifest are written and
+compressed, and files of replaced or removed shards are deleted afterwards.
+
+Usage:
+    python build_static_api.py                 # Build into build/api
+    python build_static_api.py <output dir>    # Build into another directory
+    python build_static_api.py --full          # Rewrite every shard
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Optional
+
+from loader import Dataset
+from snapshot import load_dataset_cached
+from transform import committee_node, full_name, name_key, person_node
+
+try:
+    import brotli
+except ImportError:  # Optional: only the .br variants need it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT_DIR = Path(__file__).parent.parent / "build" / "api"
+
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# Hex digits of the content hash used in shard file names
+HASH_LENGTH = 12
+
+CHAMBER_SUBTYPES = ["senate", "house"]
+
+
+def _encode(payload) -> bytes:
+    """Serialize a shard compactly and deterministically."""
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def render_shards(dataset: Dataset) -> Dict[str, bytes]:
+    """Render every shard; returns logical path -> JSON bytes."""
+    shards = {}
+    congresses = {c["congress_number"]: c for c in dataset.congresses}
+    chambers = {(c["congress"], c["subtype"]): c for c in dataset.chambers}
+    persons = {p["id"]: p for p in dataset.persons}
+
+    # Rosters
+    rosters = defaultdict(list)
+    for membership in dataset.memberships:
+        person = persons.get(membership["person_id"])
+        if person and membership["type"] == "chamber" and membership["subtype"] in CHAMBER_SUBTYPES:
+            member = {
+                "id": person["id"],
+                "full_name": full_name(person),
+                "first_name": person.get("first_name"),
+                "last_name": person.get("last_name"),
+            }
+            if membership["position"]:
+                member["position"] = membership["position"]
+            rosters[(membership["congress"], membership["subtype"])].append(member)
+
+    for (number, subtype), chamber in chambers.items():
+        congress = congresses.get(number)
+        if congress is None:
+            continue
+        members = sorted(rosters.get((number, subtype), []),
+                         key=lambda m: (name_key(m["last_name"] or ""), name_key(m["first_name"] or "")))
+        shards[f"congress/{number}/{subtype}.json"] = _encode({
+            "congress": {key: congress.get(key) for key in ["id", "congress_number", "ordinal", "name", "year_range"]},
+            "chamber": {key: chamber.get(key) for key in ["id", "name", "subtype"]},
+            "members": members,
+        })
+
+    # People
+    person_memberships = defaultdict(list)
+    for membership in dataset.memberships:
+        if membership["type"] == "chamber":
+            chamber = chambers.get((membership["congress"], membership["subtype"]))
+            person_memberships[membership["person_id"]].append({
+                "congress": membership["congress"],
+                "subtype": membership["subtype"],
+                "chamber_id": chamber["id"] if chamber else None,
+                "position": membership["position"],
+            })
+    for person_id, person in persons.items():
+        memberships = sorted(person_memberships.get(person_id, []),
+                             key=lambda m: (m["congress"] or 0, m["subtype"] or ""))
+        shards[f"person/{person_id}.json"] = _encode({**person_node(person), "memberships": memberships})
+
+    # Committees per congress
+    committees = defaultdict(list)
+    for committee in dataset.committees:
+        for number in committee.get("congresses", []):
+            committees[number].append(committee_node(committee))
+    for number in congresses:
+        shards[f"committee/{number}.json"] = _encode({
+            "congress_number": number,
+            "committees": sorted(committees.get(number, []), key=lambda c: (c.get("name") or "", c["id"])),
+        })
+
+    return shards
+
+
+def _hashed_path(logical_path: str, digest: str) -> str:
+    stem, suffix = logical_path.rsplit(".", 1)
+    return f"{stem}.{digest[:HASH_LENGTH]}.{suffix}"
+
+
+def _write_variants(path: Path, content: bytes):
+    """Write a file with its precompressed gzip (and, if available, brotli) variants."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    # mtime=0 keeps the gzip output identical for identical content
+    Path(f"{path}.gz").write_bytes(gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        Path(f"{path}.br").write_bytes(brotli.compress(content, quality=11))
+
+
+def _remove_variants(path: Path):
+    for variant in [path, Path(f"{path}.gz"), Path(f"{path}.br")]:
+        if variant.exists():
+            variant.unlink()
+
+
+def load_manifest(output_dir: Path) -> Optional[dict]:
+    """Read the manifest of a previous build, if there is a compatible one."""
+    manifest_path = output_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return None
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable manifest {manifest_path}: {e}")
+        return None
+    return manifest if manifest.get("version") == MANIFEST_VERSION else None
+
+
+def build_static_api(dataset: Dataset, output_dir: Path, full: bool = False) -> Dict[str, int]:
+    """Render shards and write the changed ones; returns counts of what was done."""
+    # Loaded even for a full build, so the files of the last build are still cleaned up
+    previous = (load_manifest(output_dir) or {}).get("shards", {})
+    shards = render_shards(dataset)
+
+    entries = {}
+    written = 0
+    for logical_path, content in sorted(shards.items()):
+        digest = hashlib.sha256(content).hexdigest()
+        entry = {"path": _hashed_path(logical_path, digest), "sha256": digest, "bytes": len(content)}
+        old = previous.get(logical_path)
+        if full or old is None or old.get("sha256") != digest or not (output_dir / entry["path"]).exists():
+            _write_variants(output_dir / entry["path"], content)
+            written += 1
+        entries[logical_path] = entry
+
+    # Publish the new manifest atomically, then drop files it no longer references
+    manifest = {"version": MANIFEST_VERSION, "shards": entries}
+    manifest_path = output_dir / MANIFEST_NAME
+    temp_path = manifest_path.with_name(MANIFEST_NAME + ".tmp")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    temp_path.write_bytes(_encode(manifest))
+    os.replace(temp_path, manifest_path)
+    _write_variants(manifest_path, manifest_path.read_bytes())
+
+    removed = 0
+    for logical_path, old in previous.items():
+        if entries.get(logical_path, {}).get("path") != old.get("path"):
+            _remove_variants(output_dir / old["path"])
+            removed += 1
+
+    return {"shards": len(entries), "written": written, "removed": removed}
+
+
+def main():
+    """Build the static JSON API."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    parser = argparse.ArgumentParser(description="Render the dataset as static JSON shards.")
+    parser.add_argument("output", type=Path, nargs="?", default=DEFAULT_OUTPUT_DIR,
+                        help=f"Output directory (default: {DEFAULT_OUTPUT_DIR})")
+    parser.add_argument("--full", action="store_true", help="Rewrite every shard, ignoring the last build")
+    args = parser.parse_args()
+
+    data_dir = Path(__file__).parent.parent / "data"
+    dataset = load_dataset_cached(data_dir)
+    if dataset.errors:
+        logger.error(f"{len(dataset.errors)} files failed to load; refusing to publish partial shards")
+        sys.exit(1)
+    if brotli is None:
+        logger.warning("brotli is not installed; writing gzip variants only")
+
+    counts = build_static_api(dataset, args.output, full=args.full)
+    logger.info(
+        f"{counts['shards']} shards in {args.output}: {counts['written']} written, "
+        f"{counts['removed']} old files removed"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Watch the data directory for edited, added and deleted entity files.
+
+Polls the entity directories (a stat per file, no parsing) and groups changes
+into batches: a batch is released once no further change has been seen for
+the debounce window, so saving several files at once, or an editor writing a
+file in several steps, produces one batch.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from loader import CHAMBER_MAPPING_FILES, ENTITY_DIRS
+
+# Seconds between scans of the data directory
+DEFAULT_POLL_INTERVAL = 0.2
+
+# Seconds without further changes before a batch is released
+DEFAULT_DEBOUNCE = 0.3
+
+
+class DataChanges(NamedTuple):
+    """A settled batch of changes, keyed by entity type (see ENTITY_DIRS)."""
+
+    changed: Dict[str, List[Path]]
+    deleted: Dict[str, List[str]]
+    mapping_changed: bool
+
+
+class DataWatcher:
+    """Polls the entity directories and yields debounced batches of changes."""
+
+    def __init__(self, data_dir: Path, debounce: float = DEFAULT_DEBOUNCE,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL):
+        self.data_dir = data_dir
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._entity_by_dir = {data_dir / entity_dir: entity for entity, entity_dir in ENTITY_DIRS.items()}
+        self._mapping_files = {
+            data_dir / ENTITY_DIRS["chamber"] / file_name for file_name in CHAMBER_MAPPING_FILES.values()
+        }
+        self._state = self._scan()
+        self._pending: Set[Path] = set()
+        self._last_change: Optional[float] = None
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        """(mtime, size) of every entity and chamber mapping file."""
+        state = {}
+        for entity_dir in self._entity_by_dir:
+            try:
+                entries = list(os.scandir(entity_dir))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                path = Path(entry.path)
+                is_entity = entry.name.endswith(".toml") and not entry.name.startswith(".")
+                if not (is_entity or path in self._mapping_files):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                state[path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def poll(self) -> Optional[DataChanges]:
+        """Check for changes once; returns a batch once the changes have settled."""
+        state = self._scan()
+        touched = {path for path in state.keys() | self._state.keys() if state.get(path) != self._state.get(path)}
+        self._state = state
+        now = time.monotonic()
+        if touched:
+            self._pending |= touched
+            self._last_change = now
+
+        if not self._pending or now - self._last_change < self.debounce:
+            return None
+
+        changes = DataChanges(
+            changed={entity: [] for entity in ENTITY_DIRS},
+            deleted={entity: [] for entity in ENTITY_DIRS},
+            mapping_changed=False,
+        )
+        for path in sorted(self._pending):
+            if path in self._mapping_files:
+                changes = changes._replace(mapping_changed=True)
+                continue
+            entity = self._entity_by_dir[path.parent]
+            if path in state:
+                changes.changed[entity].append(path)
+            else:
+                # Entity files are named after their ULID
+                changes.deleted[entity].append(path.stem)
+        self._pending = set()
+        return changes
+
+    def watch(self) -> Iterator[DataChanges]:
+        """Yield batches of changes until interrupted."""
+        while True:
+            changes = self.poll()
+            if changes:
+                yield changes
+            time.sleep(self.poll_interval)
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Export the dataset as CSV files for `neo4j-admin database import`.
+
+Writes one node file per label (Congress, Group, Committee, Person) and one
+relationship file per type (BELONGS_TO, MEMBER_OF), with typed headers, using
+the same property mapping as the Neo4j sync. Rows are sorted by id so the
+output is deterministic and can be diffed against a golden copy.
+
+Usage:
+    python export_neo4j_import.py                 # Write CSVs to build/neo4j-import
+    python export_neo4j_import.py <output dir>    # Write CSVs to another directory
+
+Then, with the target database stopped:
+    neo4j-admin database import full --array-delimiter=";" \\
+        --nodes=Congress=congress.csv --nodes=Group=group.csv \\
+        --nodes=Committee=committee.csv --nodes=Person=person.csv \\
+        --relationships=BELONGS_TO=belongs_to.csv \\
+        --relationships=MEMBER_OF=member_of.csv neo4j
+"""
+
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from loader import Dataset
+from snapshot import load_dataset_cached
+from transform import (
+    chamber_congress_edge, chamber_node, committee_congress_edges, committee_node,
+    congress_node, person_chamber_edges, person_node,
+)
+
+logger = logging.getLogger(__name__)
+
+ARRAY_DELIMITER = ";"
+
+DEFAULT_OUTPUT_DIR = Path(__file__).parent.parent / "build" / "neo4j-import"
+
+
+def _value_type(value) -> str:
+    """neo4j-admin import type of a Python value."""
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "long"
+    if isinstance(value, float):
+        return "double"
+    return "string"
+
+
+def _column_type(name: str, values: List) -> str:
+    """Infer one column's type from its (non-missing) values."""
+    types = set()
+    for value in values:
+        if isinstance(value, list):
+            types.update(_value_type(item) + "[]" for item in value)
+        else:
+            types.add(_value_type(value))
+
+    if len(types) == 1:
+        return types.pop()
+    if types and all(t.endswith("[]") for t in types):
+        logger.warning(f"Column {name} mixes {sorted(types)}; exporting as string[]")
+        return "string[]"
+    if types:
+        logger.warning(f"Column {name} mixes {sorted(types)}; exporting as string")
+    return "string"
+
+
+def _format_value(value) -> str:
+    """Render a property value as a CSV field.
+
+    Missing values become empty unquoted fields, which neo4j-admin skips (no
+    property), while strings are always quoted so an empty string survives.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, list):
+        items = ["true" if item is True else "false" if item is False else str(item) for item in value]
+        for item in items:
+            if ARRAY_DELIMITER in item:
+                raise ValueError(f"Array value {item!r} contains the delimiter {ARRAY_DELIMITER!r}")
+        value = ARRAY_DELIMITER.join(items)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _write_csv(path: Path, header: List[str], rows):
+    """Write pre-formatted fields as CSV lines."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(",".join(header) + "\n")
+        for row in rows:
+            f.write(",".join(row) + "\n")
+
+
+def write_nodes(path: Path, nodes: List[dict]):
+    """Write a node file whose `id` property doubles as the import ID."""
+    nodes = sorted(nodes, key=lambda node: node["id"])
+    names = ["id"] + [name for name in dict.fromkeys(k for node in nodes for k in node) if name != "id"]
+    header = ["id:ID"] + [
+        f"{name}:{_column_type(name, [n[name] for n in nodes if name in n])}" for name in names[1:]
+    ]
+
+    _write_csv(path, header, ([_format_value(node.get(name)) for name in names] for node in nodes))
+
+
+def write_relationships(path: Path, rows: List[dict], start: str, end: str,
+                        properties: Dict[str, str] = None):
+    """Write a relationship file from rows keyed by `start`/`end` id columns."""
+    properties = properties or {}
+    rows = sorted(rows, key=lambda row: (row[start], row[end]))
+    header = [":START_ID", ":END_ID"] + [f"{name}:{t}" for name, t in properties.items()]
+
+    _write_csv(path, header, (
+        [_format_value(row[start]), _format_value(row[end])]
+        + [_format_value(row.get(name)) for name in properties]
+        for row in rows
+    ))
+
+
+def export_import_csvs(dataset: Dataset, output_dir: Path) -> Dict[str, int]:
+    """Write the neo4j-admin import files; returns row counts per file."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    congress_mapping = dataset.congress_mapping()
+    chamber_mapping = dataset.chamber_mapping()
+
+    belongs_to = []
+    for chamber in dataset.chambers:
+        edge = chamber_congress_edge(chamber, congress_mapping)
+        if edge:
+            belongs_to.append({"start": edge["chamber_id"], "end": edge["congress_id"]})
+    for committee in dataset.committees:
+        for edge in committee_congress_edges(committee, congress_mapping):
+            belongs_to.append({"start": edge["committee_id"], "end": edge["congress_id"]})
+
+    member_of = []
+    unresolved = 0
+    for person in dataset.persons:
+        edges, missing = person_chamber_edges(person, chamber_mapping)
+        member_of.extend(edges)
+        unresolved += missing
+    if unresolved:
+        logger.warning(f"Skipping {unresolved} memberships that reference a missing chamber")
+
+    nodes = {
+        "congress.csv": [congress_node(c) for c in dataset.congresses],
+        "group.csv": [chamber_node(c) for c in dataset.chambers],
+        "committee.csv": [committee_node(c) for c in dataset.committees],
+        "person.csv": [person_node(p) for p in dataset.persons],
+    }
+    for file_name, rows in nodes.items():
+        write_nodes(output_dir / file_name, rows)
+
+    write_relationships(output_dir / "belongs_to.csv", belongs_to, "start", "end")
+    write_relationships(output_dir / "member_of.csv", member_of, "person_id", "chamber_id",
+                        {"position": "string"})
+
+    counts = {file_name: len(rows) for file_name, rows in nodes.items()}
+    counts["belongs_to.csv"] = len(belongs_to)
+    counts["member_of.csv"] = len(member_of)
+    return counts
+
+
+def main():
+    """Export the dataset to neo4j-admin import CSVs."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    data_dir = Path(__file__).parent.parent / "data"
+    output_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_OUTPUT_DIR
+
+    dataset = load_dataset_cached(data_dir)
+    if dataset.errors:
+        logger.error(f"{len(dataset.errors)} files failed to load; refusing to export a partial graph")
+        sys.exit(1)
+
+    counts = export_import_csvs(dataset, output_dir)
+    for file_name, count in counts.items():
+        logger.info(f"Wrote {count} rows to {output_dir / file_name}")
+
+    logger.info(
+        "Import with: neo4j-admin database import full --array-delimiter=\";\" "
+        "--nodes=Congress=congress.csv --nodes=Group=group.csv "
+        "--nodes=Committee=committee.csv --nodes=Person=person.csv "
+        "--relationships=BELONGS_TO=belongs_to.csv --relationships=MEMBER_OF=member_of.csv <database>"
+    )
+
+
+if __name__ == "__main__":
+    main()
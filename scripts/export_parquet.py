@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Export the dataset as Parquet tables for analysis.
+
+Writes one table per entity (congress, chamber, committee, person) plus two
+long-format tables that are otherwise rebuilt by hand from the TOML arrays:
+
+    memberships          person_id, type, subtype, congress, position
+    committee_congress   committee_id, congress (one row per graph BELONGS_TO edge)
+
+Repeated strings (type, subtype, position) are stored as categoricals, which
+Parquet writes dictionary-encoded, so the whole dataset stays a few MB and
+loads with a single `pandas.read_parquet` per table.
+
+Usage:
+    python export_parquet.py                 # Write tables to build/parquet
+    python export_parquet.py <output dir>    # Write tables to another directory
+"""
+
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from loader import Dataset
+from snapshot import load_dataset_cached
+from transform import chamber_node, committee_congress_edges, committee_node, congress_node, person_node
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_OUTPUT_DIR = Path(__file__).parent.parent / "build" / "parquet"
+
+# Low-cardinality string columns to dictionary-encode, per table
+CATEGORICAL_COLUMNS = {
+    "chamber": ["type", "subtype"],
+    "committee": ["type"],
+    "memberships": ["type", "subtype", "position"],
+}
+
+
+def _frame(rows: List[dict], columns: Optional[List[str]] = None,
+           categorical: Optional[List[str]] = None) -> pd.DataFrame:
+    """Build a DataFrame with nullable integers and categorical string columns."""
+    frame = pd.DataFrame.from_records(rows, columns=columns)
+    for name in frame.columns:
+        # from_records has already widened integer columns with gaps to float,
+        # so check (and rebuild) them from the source records
+        source = [row.get(name) for row in rows]
+        values = [v for v in source if v is not None]
+        if values and all(isinstance(v, int) and not isinstance(v, bool) for v in values):
+            frame[name] = pd.array(source, dtype="Int64")
+    for name in categorical or []:
+        if name in frame.columns:
+            frame[name] = frame[name].astype("category")
+    return frame
+
+
+def build_tables(dataset: Dataset) -> Dict[str, pd.DataFrame]:
+    """Build every exported table from a loaded dataset."""
+    # One row per BELONGS_TO edge of the graph, keyed by congress number
+    congress_mapping = dataset.congress_mapping()
+    congress_numbers = {congress_id: number for number, congress_id in congress_mapping.items()}
+    committee_congress = [
+        {"committee_id": edge["committee_id"], "congress": congress_numbers[edge["congress_id"]]}
+        for committee in dataset.committees
+        for edge in committee_congress_edges(committee, congress_mapping)
+    ]
+
+    return {
+        "congress": _frame([congress_node(c) for c in dataset.congresses]),
+        "chamber": _frame([chamber_node(c) for c in dataset.chambers],
+                          categorical=CATEGORICAL_COLUMNS["chamber"]),
+        "committee": _frame([committee_node(c) for c in dataset.committees],
+                            categorical=CATEGORICAL_COLUMNS["committee"]),
+        "person": _frame([person_node(p) for p in dataset.persons]),
+        "memberships": _frame(dataset.memberships,
+                              columns=["person_id", "type", "subtype", "congress", "position"],
+                              categorical=CATEGORICAL_COLUMNS["memberships"]),
+        "committee_congress": _frame(committee_congress, columns=["committee_id", "congress"]),
+    }
+
+
+def export_parquet(dataset: Dataset, output_dir: Path) -> Dict[str, int]:
+    """Write each table to `<output_dir>/<table>.parquet`; returns row counts per table."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    counts = {}
+    for name, frame in build_tables(dataset).items():
+        if "id" in frame.columns:
+            frame = frame.sort_values("id", ignore_index=True)
+        frame.to_parquet(output_dir / f"{name}.parquet", engine="pyarrow", index=False)
+        counts[name] = len(frame)
+    return counts
+
+
+def main():
+    """Export the dataset to Parquet."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    data_dir = Path(__file__).parent.parent / "data"
+    output_dir = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_OUTPUT_DIR
+
+    dataset = load_dataset_cached(data_dir)
+    if dataset.errors:
+        logger.error(f"{len(dataset.errors)} files failed to load; refusing to export partial tables")
+        sys.exit(1)
+
+    counts = export_parquet(dataset, output_dir)
+    for name, count in counts.items():
+        logger.info(f"Wrote {count} rows to {output_dir / name}.parquet")
+
+
+if __name__ == "__main__":
+    main()
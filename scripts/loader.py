@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Fast, read-only loader for the Philippine Congress TOML data.
+
+Parses the `data/` tree with the stdlib `tomllib` parser (much faster than the
+style-preserving `tomlkit`) across a process pool, and returns plain dicts
+grouped into typed collections that the sync and export tools consume.
+
+Usage:
+    python loader.py              # Load the dataset and print entity counts
+"""
+
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    import tomli as tomllib
+
+logger = logging.getLogger(__name__)
+
+# Entity type -> data directory, relative to the data root
+ENTITY_DIRS = {
+    "congress": Path("congress"),
+    "chamber": Path("group") / "chamber",
+    "committee": Path("committee"),
+    "person": Path("person"),
+}
+
+# Chamber subtype -> file mapping congress numbers to chamber ids
+CHAMBER_MAPPING_FILES = {
+    "house": ".congress-number-hor-mapping.yml",
+    "senate": ".congress-number-senate-mapping.yml",
+}
+
+# Below this many files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 64
+
+# Files parsed per chunk when streaming records
+STREAM_CHUNK_SIZE = 1024
+
+
+@dataclass
+class Dataset:
+    """Parsed entities from the data directory, as plain dicts."""
+
+    congresses: List[dict] = field(default_factory=list)
+    chambers: List[dict] = field(default_factory=list)
+    committees: List[dict] = field(default_factory=list)
+    persons: List[dict] = field(default_factory=list)
+    # One row per person membership: person_id, type, subtype, congress, position
+    memberships: List[dict] = field(default_factory=list)
+    # Entity id -> source file
+    sources: Dict[str, Path] = field(default_factory=dict)
+    # (file, error message) for files that failed to parse
+    errors: List[Tuple[Path, str]] = field(default_factory=list)
+
+    def congress_mapping(self) -> Dict[int, str]:
+        """Map congress numbers to Congress ids."""
+        return {c["congress_number"]: c["id"] for c in self.congresses}
+
+    def chamber_mapping(self) -> Dict[Tuple[int, str], str]:
+        """Map (congress number, subtype) to chamber Group ids."""
+        return {(c["congress"], c["subtype"]): c["id"] for c in self.chambers}
+
+
+def list_entity_files(data_dir: Path, entity: str) -> List[Path]:
+    """List the TOML files of an entity type, skipping hidden mapping files."""
+    entity_dir = data_dir / ENTITY_DIRS[entity]
+    if not entity_dir.exists():
+        return []
+    return sorted(f for f in entity_dir.glob("*.toml") if not f.name.startswith("."))
+
+
+def load_chamber_mapping(data_dir: Path) -> Dict[Tuple[int, str], str]:
+    """Read the chamber mapping files into (congress number, subtype) -> chamber id."""
+    mapping = {}
+    chambers_dir = data_dir / ENTITY_DIRS["chamber"]
+    for subtype, file_name in CHAMBER_MAPPING_FILES.items():
+        mapping_file = chambers_dir / file_name
+        if not mapping_file.exists():
+            continue
+        with open(mapping_file, "r", encoding="utf-8") as f:
+            for congress, chamber_id in (yaml.safe_load(f) or {}).items():
+                mapping[(int(congress), subtype)] = chamber_id
+    return mapping
+
+
+def scan_chamber_mapping(data_dir: Path) -> Dict[Tuple[int, str], str]:
+    """Map (congress number, subtype) to chamber ids by parsing every chamber file.
+
+    Unlike the mapping files, this can't miss a chamber that has a file. There
+    are only a few dozen chamber files, so they are parsed serially.
+    """
+    mapping = {}
+    for file_path, data, error in parse_files(list_entity_files(data_dir, "chamber"), workers=1):
+        if error is None and "id" in data:
+            mapping[(data.get("congress"), data.get("subtype"))] = data["id"]
+    return mapping
+
+
+def _parse_file(file_path: Path) -> Tuple[Path, Optional[dict], Optional[str]]:
+    """Parse a single TOML file, returning (path, data, error)."""
+    try:
+        with open(file_path, "rb") as f:
+            return file_path, tomllib.load(f), None
+    except Exception as e:
+        return file_path, None, str(e)
+
+
+def process_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Create a process pool for `parse_files`.
+
+    Workers are started by a fork server (or spawned where there is none)
+    rather than forked: the sync parses while its writer and driver threads
+    run, and forking a multi-threaded process can deadlock the child.
+    """
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                               mp_context=multiprocessing.get_context(start_method))
+
+
+def parse_files(files: List[Path], workers: Optional[int] = None,
+                executor: Optional[ProcessPoolExecutor] = None):
+    """Parse TOML files, in parallel when there are enough of them.
+
+    Yields (path, data, error) tuples in the order of `files`. Pass an
+    `executor` from `process_pool` to reuse one pool across calls.
+    """
+    if workers == 1 or len(files) < PARALLEL_THRESHOLD:
+        yield from map(_parse_file, files)
+        return
+
+    chunksize = max(1, len(files) // ((workers or os.cpu_count() or 1) * 4))
+    if executor is not None:
+        yield from executor.map(_parse_file, files, chunksize=chunksize)
+        return
+    with process_pool(workers) as executor:
+        yield from executor.map(_parse_file, files, chunksize=chunksize)
+
+
+def flatten_memberships(person: dict) -> List[dict]:
+    """Turn a person's `memberships` array into rows keyed by person id."""
+    return [
+        {
+            "person_id": person["id"],
+            "type": membership.get("type"),
+            "subtype": membership.get("subtype"),
+            "congress": membership.get("congress"),
+            "position": membership.get("position", ""),
+        }
+        for membership in person.get("memberships", [])
+    ]
+
+
+def iter_records(
+    data_dir: Path,
+    entity: str,
+    files: Optional[List[Path]] = None,
+    errors: Optional[List[Tuple[Path, str]]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[dict]:
+    """Stream the records of one entity type, parsing `chunk_size` files at a time.
+
+    Only one chunk of parsed records is held at once, so memory stays bounded
+    however many files there are. All chunks share one process pool. Files that
+    fail to parse are logged and, if `errors` is given, appended to it.
+    """
+    paths = sorted(files) if files is not None else list_entity_files(data_dir, entity)
+    executor = process_pool(workers) if workers != 1 and len(paths) >= PARALLEL_THRESHOLD else None
+    try:
+        for start in range(0, len(paths), chunk_size):
+            chunk = paths[start:start + chunk_size]
+            for file_path, data, error in parse_files(chunk, workers=workers, executor=executor):
+                if error is None and "id" not in data:
+                    error = "missing id"
+                if error is not None:
+                    logger.error(f"Failed to load {file_path}: {error}")
+                    if errors is not None:
+                        errors.append((file_path, error))
+                    continue
+                yield data
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def load_dataset(
+    data_dir: Path,
+    files: Optional[Dict[str, List[Path]]] = None,
+    workers: Optional[int] = None,
+) -> Dataset:
+    """Load entities from the data directory.
+
+    If `files` is given, entity types present in it are loaded from those files
+    only; the rest are loaded in full.
+    """
+    start_time = time.time()
+    dataset = Dataset()
+    collections = {
+        "congress": dataset.congresses,
+        "chamber": dataset.chambers,
+        "committee": dataset.committees,
+        "person": dataset.persons,
+    }
+
+    # Parse everything in one pool so small directories don't pay for their own
+    entity_files = []
+    for entity in ENTITY_DIRS:
+        if files is not None and entity in files:
+            paths = sorted(files[entity])
+        else:
+            paths = list_entity_files(data_dir, entity)
+        entity_files.extend((entity, path) for path in paths)
+
+    parsed = parse_files([path for _, path in entity_files], workers=workers)
+    for (entity, _), (file_path, data, error) in zip(entity_files, parsed):
+        if error is None and "id" not in data:
+            error = "missing id"
+        if error is not None:
+            logger.error(f"Failed to load {file_path}: {error}")
+            dataset.errors.append((file_path, error))
+            continue
+
+        collections[entity].append(data)
+        dataset.sources[data["id"]] = file_path
+        if entity == "person":
+            dataset.memberships.extend(flatten_memberships(data))
+
+    logger.info(
+        f"Loaded {len(dataset.congresses)} congresses, {len(dataset.chambers)} chambers, "
+        f"{len(dataset.committees)} committees, {len(dataset.persons)} people "
+        f"({len(dataset.memberships)} memberships) in {time.time() - start_time:.2f}s"
+    )
+    return dataset
+
+
+def main():
+    """Load the dataset and report what was found."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    data_dir = Path(__file__).parent.parent / "data"
+    dataset = load_dataset(data_dir)
+    if dataset.errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+In-process lookup of people in the Philippine Congress dataset.
+
+Builds hash indexes once over the loaded dataset, so resolving a scraped Senate
+or House key (or a ULID, last name or alias) to a person is a dict lookup
+rather than a directory walk, and chamber rosters need no Neo4j.
+
+Usage:
+    python lookup.py id <ULID>                    # Exact ULID
+    python lookup.py prefix <ULID prefix>         # ULID prefix
+    python lookup.py senate-key <KEY>             # senate_website_keys
+    python lookup.py primary-key <KEY>            # congress_website_primary_keys
+    python lookup.py author-key <KEY>             # congress_website_author_keys
+    python lookup.py last-name <NAME>             # last_name (case-insensitive)
+    python lookup.py alias <ALIAS>                # aliases (case-insensitive)
+    python lookup.py roster <CONGRESS> <senate|house>
+"""
+
+import bisect
+import logging
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from loader import Dataset
+from snapshot import load_dataset_cached
+from transform import full_name, name_key
+
+logger = logging.getLogger(__name__)
+
+
+class PersonIndex:
+    """Hash indexes over the people of a loaded dataset."""
+
+    def __init__(self, dataset: Dataset):
+        """Build every index in a single pass over persons and memberships."""
+        self.dataset = dataset
+        self.by_id: Dict[str, dict] = {}
+        self._sorted_ids: List[str] = []
+        self._senate_keys: Dict[str, List[dict]] = defaultdict(list)
+        self._primary_keys: Dict[int, List[dict]] = defaultdict(list)
+        self._author_keys: Dict[str, List[dict]] = defaultdict(list)
+        self._last_names: Dict[str, List[dict]] = defaultdict(list)
+        self._aliases: Dict[str, List[dict]] = defaultdict(list)
+        self._rosters: Dict[tuple, List[dict]] = defaultdict(list)
+
+        for person in dataset.persons:
+            self.by_id[person["id"]] = person
+            for key in person.get("senate_website_keys", []):
+                self._senate_keys[str(key).upper()].append(person)
+            for key in person.get("congress_website_primary_keys", []):
+                self._primary_keys[int(key)].append(person)
+            for key in person.get("congress_website_author_keys", []):
+                self._author_keys[str(key).upper()].append(person)
+            if person.get("last_name"):
+                self._last_names[name_key(person["last_name"])].append(person)
+            for alias in person.get("aliases", []):
+                self._aliases[name_key(alias)].append(person)
+
+        self._sorted_ids = sorted(self.by_id)
+
+        for membership in dataset.memberships:
+            person = self.by_id.get(membership["person_id"])
+            if person and membership["type"] == "chamber":
+                self._rosters[(membership["congress"], membership["subtype"])].append(person)
+        for members in self._rosters.values():
+            members.sort(key=lambda p: (name_key(p.get("last_name", "")), name_key(p.get("first_name", ""))))
+
+    def get(self, person_id: str) -> Optional[dict]:
+        """Look up a person by exact ULID."""
+        return self.by_id.get(person_id.upper())
+
+    def find_by_id_prefix(self, prefix: str) -> List[dict]:
+        """Find people whose ULID starts with `prefix`."""
+        prefix = prefix.upper()
+        start = bisect.bisect_left(self._sorted_ids, prefix)
+        matches = []
+        for person_id in self._sorted_ids[start:]:
+            if not person_id.startswith(prefix):
+                break
+            matches.append(self.by_id[person_id])
+        return matches
+
+    def find_by_senate_key(self, key: str) -> List[dict]:
+        return list(self._senate_keys.get(str(key).upper(), []))
+
+    def find_by_primary_key(self, key: int) -> List[dict]:
+        return list(self._primary_keys.get(int(key), []))
+
+    def find_by_author_key(self, key: str) -> List[dict]:
+        return list(self._author_keys.get(str(key).upper(), []))
+
+    def find_by_last_name(self, last_name: str) -> List[dict]:
+        return list(self._last_names.get(name_key(last_name), []))
+
+    def find_by_alias(self, alias: str) -> List[dict]:
+        return list(self._aliases.get(name_key(alias), []))
+
+    def roster(self, congress: int, subtype: str) -> List[dict]:
+        """List the members of a chamber ('senate' or 'house') in a congress."""
+        return list(self._rosters.get((int(congress), subtype.lower()), []))
+
+
+def load_person_index(data_dir: Path) -> PersonIndex:
+    """Load the dataset (through the snapshot) and index it."""
+    return PersonIndex(load_dataset_cached(data_dir))
+
+
+def main():
+    """Run a single lookup from the command line."""
+    logging.basicConfig(
+        level=logging.WARNING, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    commands = {
+        "id": lambda index, value: [p for p in [index.get(value)] if p],
+        "prefix": PersonIndex.find_by_id_prefix,
+        "senate-key": PersonIndex.find_by_senate_key,
+        "primary-key": PersonIndex.find_by_primary_key,
+        "author-key": PersonIndex.find_by_author_key,
+        "last-name": PersonIndex.find_by_last_name,
+        "alias": PersonIndex.find_by_alias,
+    }
+
+    args = sys.argv[1:]
+    valid = (len(args) == 2 and args[0] in commands) or (len(args) == 3 and args[0] == "roster")
+    if not valid:
+        print(__doc__.split("Usage:")[1].rstrip())
+        sys.exit(1)
+    # Congress website primary keys and congress numbers are integers
+    if args[0] in ["primary-key", "roster"] and not args[1].isdigit():
+        print(f"{args[0]}: expected a number, got {args[1]!r}", file=sys.stderr)
+        sys.exit(1)
+
+    data_dir = Path(__file__).parent.parent / "data"
+    index = load_person_index(data_dir)
+    if args[0] == "roster":
+        people = index.roster(int(args[1]), args[2])
+    else:
+        people = commands[args[0]](index, args[1])
+
+    for person in people:
+        source = index.dataset.sources.get(person["id"], "")
+        print(f"{person['id']}\t{full_name(person)}\t{source}")
+
+    if not people:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Pipelined writer for Neo4j.
+
+Runs managed write transactions (`session.execute_write`) for many batches
+concurrently on a thread pool, so sync time isn't bound by one round trip at a
+time to a remote instance. Submitting blocks once `max_pending` batches are
+queued, which keeps memory bounded however fast batches are produced.
+
+Transient failures (deadlocks between concurrent transactions, leader
+switches, dropped connections) are retried by the driver and then again here
+with backoff; batches that still fail are recorded in `failures` instead of
+being dropped. With a `SyncMetrics`, the time and outcome of every
+transaction is recorded; with a `SyncJournal`, every committed batch is
+checkpointed.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set
+
+from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_ERRORS = (TransientError, ServiceUnavailable, SessionExpired)
+
+
+class PipelinedWriter:
+    """Bounded, concurrent executor of write transactions."""
+
+    def __init__(self, driver, workers: int = 4, max_pending: int = 8,
+                 max_retries: int = 3, database: Optional[str] = None, metrics=None, journal=None):
+        """Create the worker pool.
+
+        `max_pending` is the number of batches that may wait for a worker on
+        top of the ones being written.
+        """
+        self.driver = driver
+        self.database = database
+        self.max_retries = max_retries
+        self.metrics = metrics
+        self.journal = journal
+        self.failures: List[Dict] = []
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="neo4j-writer")
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+        self._pending: Set[Future] = set()
+        self._lock = threading.Lock()
+
+    def submit(self, description: str, tx_function: Callable, *args,
+               checkpoint: Optional[Dict] = None, **kwargs) -> Future:
+        """Queue `tx_function(tx, *args, **kwargs)` to run in its own write transaction.
+
+        Blocks while the queue is full. `description` identifies the batch in
+        logs and in `failures`; `checkpoint` is recorded in the journal once
+        the transaction commits, or with the failure if it doesn't.
+        """
+        self._slots.acquire()
+        future = self._executor.submit(self._run, description, tx_function, args, kwargs, checkpoint)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future: Future):
+        with self._lock:
+            self._pending.discard(future)
+        self._slots.release()
+
+    def _run(self, description: str, tx_function: Callable, args: tuple, kwargs: dict,
+             checkpoint: Optional[Dict] = None):
+        """Run one transaction, retrying transient errors with exponential backoff."""
+        start = time.time()
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                with self.driver.session(database=self.database) as session:
+                    result = session.execute_write(tx_function, *args, **kwargs)
+                self._record_transaction(description, start, attempt, failed=False)
+                if self.journal and checkpoint:
+                    self.journal.record(checkpoint)
+                return result
+            except RETRYABLE_ERRORS as e:
+                if attempt == self.max_retries:
+                    self._record_failure(description, e, checkpoint)
+                    self._record_transaction(description, start, attempt, failed=True)
+                    return None
+                delay = 2 ** (attempt - 1)
+                logger.warning(f"Retrying {description} in {delay}s after transient error: {e}")
+                time.sleep(delay)
+            except Exception as e:
+                self._record_failure(description, e, checkpoint)
+                self._record_transaction(description, start, attempt, failed=True)
+                return None
+
+    def _record_transaction(self, description: str, start: float, attempts: int, failed: bool):
+        if self.metrics:
+            self.metrics.record_transaction(description, time.time() - start, attempts, failed)
+
+    def _record_failure(self, description: str, error: Exception, checkpoint: Optional[Dict] = None):
+        logger.error(f"Failed to write {description}: {error}")
+        with self._lock:
+            self.failures.append({"batch": description, "error": str(error), "checkpoint": checkpoint})
+
+    def flush(self):
+        """Wait until every submitted batch has been written (or has failed)."""
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                return
+            for future in pending:
+                future.result()
+
+    def close(self):
+        """Flush outstanding batches and stop the workers."""
+        self.flush()
+        self._executor.shutdown(wait=True)
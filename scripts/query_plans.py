@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Capture query plans and read latencies, and compare them with a baseline.
+
+Covers the query patterns documented in DATABASE.md and the write statements
+of the sync. Read queries are run with PROFILE (db hits, rows) and then timed
+over repeated executions. Write statements are only EXPLAINed, so the database
+is never modified. For every query the report records which operators the
+planner chose and whether it used an index or had to scan a label.
+
+Saving a baseline and checking against it makes the effect of schema and
+index changes measurable: a query that stops using an index, does many more
+db hits, or gets slower is reported as a regression. The baseline
+(`scripts/query_plans_baseline.json`) is committed, so everyone compares
+against the same plans.
+
+Usage:
+    python query_plans.py                      # Print the report (and changes vs. the baseline)
+    python query_plans.py --save-baseline      # Store the report as the new baseline
+    python query_plans.py --check              # Exit 1 on regressions vs. the baseline
+    python query_plans.py --runs 50            # Timed executions per read query (default: 20)
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+from neo4j import GraphDatabase
+
+from snapshot import load_dataset_cached
+from sync_to_neo4j import WRITE_STATEMENTS, write_statement
+from transform import (
+    chamber_congress_edge, chamber_node, committee_congress_edges, committee_node,
+    congress_node, person_chamber_edges, person_node,
+)
+
+logger = logging.getLogger(__name__)
+
+# Tracked in git, so schema and index changes are compared against a shared baseline
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "query_plans_baseline.json"
+
+DEFAULT_RUNS = 20
+
+# Relative increase in db hits or p50 latency reported as a regression
+DEFAULT_TOLERANCE = 0.25
+
+# Read query patterns from DATABASE.md
+READ_QUERIES = {
+    "congress by number": """
+        MATCH (c:Congress {congress_number: 20})
+        RETURN c
+    """,
+    "senate chambers": """
+        MATCH (g:Group {type: "chamber", subtype: "senate"})
+        RETURN g.name, g.congress
+        ORDER BY g.congress
+    """,
+    "committee name contains": """
+        MATCH (com:Committee)
+        WHERE com.name CONTAINS "Finance"
+        RETURN com
+    """,
+    "person by last name": """
+        MATCH (p:Person)
+        WHERE p.last_name = "Aquino"
+        RETURN p
+    """,
+    "senators of a congress": """
+        MATCH (p:Person)-[:MEMBER_OF]->(g:Group {type: "chamber", subtype: "senate", congress: 20})
+        RETURN p.last_name, p.first_name
+        ORDER BY p.last_name
+    """,
+    "chamber of a congress": """
+        MATCH (g:Group {type: "chamber", subtype: "senate"})-[:BELONGS_TO]->(c:Congress {congress_number: 20})
+        RETURN g, c
+    """,
+    "committees of a congress": """
+        MATCH (com:Committee)-[:BELONGS_TO]->(con:Congress {congress_number: 20})
+        RETURN com.name, con.name
+    """,
+    "career by last name": """
+        MATCH (p:Person {last_name: "Aquino"})-[:MEMBER_OF]->(g:Group)-[:BELONGS_TO]->(c:Congress)
+        RETURN p.first_name, p.last_name, g.subtype as chamber, c.ordinal
+        ORDER BY c.congress_number
+    """,
+    "membership counts by congress": """
+        MATCH (g:Group {type: "chamber"})-[:BELONGS_TO]->(c:Congress)
+        MATCH (p:Person)-[:MEMBER_OF]->(g)
+        RETURN c.ordinal, g.subtype as chamber, COUNT(DISTINCT p) as member_count
+        ORDER BY c.congress_number, g.subtype
+    """,
+    "committees in a person's congresses": """
+        MATCH (p:Person {last_name: "Angara"})-[:MEMBER_OF]->(g:Group)-[:BELONGS_TO]->(c:Congress)
+        MATCH (com:Committee)-[:BELONGS_TO]->(c)
+        RETURN DISTINCT com.name, c.ordinal
+    """,
+    "people in both chambers": """
+        MATCH (p:Person)
+        WHERE p.senate_terms > 0 AND p.house_terms > 0
+        RETURN p.full_name, p.first_congress, p.last_congress
+        ORDER BY p.last_congress DESC
+    """,
+    "person by name key prefix": """
+        MATCH (p:Person)
+        WHERE p.name_key STARTS WITH "benigno"
+        RETURN p.full_name, p.congresses_served
+    """,
+    "person by senate website key": """
+        MATCH (p:Person)
+        WHERE "ABENI" IN p.senate_website_keys
+        RETURN p
+    """,
+    "chamber roster from congress": """
+        MATCH (c:Congress {congress_number: 20})<-[:BELONGS_TO]-(g:Group {type: "chamber", subtype: "senate"})<-[:MEMBER_OF]-(p:Person)
+        RETURN p.last_name, p.first_name
+        ORDER BY p.last_name
+    """,
+}
+
+INDEX_OPERATOR_MARKERS = ["IndexSeek", "IndexScan", "IndexContainsScan", "IndexEndsWithScan"]
+LABEL_SCAN_OPERATORS = {"NodeByLabelScan", "AllNodesScan"}
+
+
+def sample_parameters(data_dir: Path) -> Dict[str, dict]:
+    """Parameters for each of the sync's write statements, built from sample records."""
+    dataset = load_dataset_cached(data_dir)
+    congress_mapping = dataset.congress_mapping()
+    chamber_mapping = dataset.chamber_mapping()
+    congress = dataset.congresses[0]
+    chamber = next(c for c in dataset.chambers if c.get("congress") in congress_mapping)
+    committee = next(c for c in dataset.committees if c.get("congresses"))
+    person = next(p for p in dataset.persons if p.get("memberships"))
+
+    return {
+        "congress nodes": {"batch": [congress_node(congress)]},
+        "chamber nodes": {"batch": [chamber_node(chamber)]},
+        "delete chamber congress edges": {"ids": [chamber["id"]]},
+        "chamber congress edges": {"batch": [chamber_congress_edge(chamber, congress_mapping)]},
+        "committee nodes": {"batch": [committee_node(committee)]},
+        "delete committee congress edges": {"ids": [committee["id"]]},
+        "committee congress edges": {"batch": committee_congress_edges(committee, congress_mapping)},
+        "person nodes": {"batch": [person_node(person)]},
+        "delete person chamber edges": {"ids": [person["id"]]},
+        "person chamber edges": {"batch": person_chamber_edges(person, chamber_mapping)[0]},
+    }
+
+
+def _operator_name(plan: dict) -> str:
+    return plan.get("operatorType", "").split("@")[0]
+
+
+def _walk(plan: dict):
+    yield plan
+    for child in plan.get("children", []):
+        yield from _walk(child)
+
+
+def analyze_plan(plan: dict, profiled: bool) -> dict:
+    """Summarize a (profiled) plan: operators, index and label-scan usage, db hits."""
+    nodes = list(_walk(plan))
+    operators = [_operator_name(node) for node in nodes]
+    summary = {
+        "operators": operators,
+        "index_used": any(marker in op for op in operators for marker in INDEX_OPERATOR_MARKERS),
+        "label_scan": any(op in LABEL_SCAN_OPERATORS for op in operators),
+        "estimated_rows": round(plan.get("args", plan.get("arguments", {})).get("EstimatedRows", 0), 1),
+    }
+    if profiled:
+        summary["db_hits"] = sum(node.get("dbHits", 0) for node in nodes)
+        summary["rows"] = plan.get("rows", 0)
+    return summary
+
+
+def _timings(session, query: str, params: dict, runs: int) -> Dict[str, float]:
+    """Client-side wall time of repeated executions, in milliseconds."""
+    session.run(query, **params).consume()  # warm up the plan cache
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        session.run(query, **params).consume()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "p50": round(samples[len(samples) // 2], 3),
+        "p95": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "max": round(samples[-1], 3),
+    }
+
+
+def capture_plans(driver, write_parameters: Dict[str, dict], runs: int) -> Dict[str, dict]:
+    """Profile and time the read queries, and EXPLAIN the sync's write statements."""
+    report = {}
+    with driver.session() as session:
+        for name, query in READ_QUERIES.items():
+            summary = session.run("PROFILE " + query).consume()
+            report[name] = {
+                "kind": "read",
+                **analyze_plan(summary.profile, profiled=True),
+                "latency_ms": _timings(session, query, {}, runs),
+            }
+            logger.info(f"Profiled {name}")
+
+        for name in WRITE_STATEMENTS:
+            params = write_parameters.get(name, {})
+            summary = session.run("EXPLAIN " + write_statement(name), **params).consume()
+            report[f"sync: {name}"] = {"kind": "write", **analyze_plan(summary.plan, profiled=False)}
+            logger.info(f"Explained sync: {name}")
+    return report
+
+
+def compare(report: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """List regressions of `report` against `baseline`."""
+    regressions = []
+    for name, current in report.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        if previous.get("index_used") and not current.get("index_used"):
+            regressions.append(f"{name}: no longer uses an index ({', '.join(current['operators'])})")
+        if current.get("label_scan") and not previous.get("label_scan"):
+            regressions.append(f"{name}: now scans a label")
+        if previous.get("db_hits") and current.get("db_hits", 0) > previous["db_hits"] * (1 + tolerance):
+            regressions.append(f"{name}: db hits {previous['db_hits']} -> {current['db_hits']}")
+        before = previous.get("latency_ms", {}).get("p50")
+        after = current.get("latency_ms", {}).get("p50")
+        if before and after and after > before * (1 + tolerance):
+            regressions.append(f"{name}: p50 latency {before:.2f}ms -> {after:.2f}ms")
+    return regressions
+
+
+def log_report(report: Dict[str, dict]):
+    """Log one line per query: access path, estimated rows and, for reads, profile and latency."""
+    for name, entry in report.items():
+        access = "index" if entry["index_used"] else "label scan" if entry["label_scan"] else "no index or scan"
+        details = f"{access}, est. rows {entry['estimated_rows']}"
+        if "db_hits" in entry:
+            details += f", {entry['db_hits']} db hits, {entry['rows']} rows, p50 {entry['latency_ms']['p50']}ms"
+        logger.info(f"{name}: {details}")
+
+
+def main():
+    """Capture query plans and compare them with the baseline."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    parser = argparse.ArgumentParser(description="Capture query plans and read latencies.")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH,
+                        help=f"Baseline file (default: {DEFAULT_BASELINE_PATH})")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--check", action="store_true", help="Exit 1 on regressions vs. the baseline")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS,
+                        help=f"Timed executions per read query (default: {DEFAULT_RUNS})")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"Allowed relative increase in db hits and latency (default: {DEFAULT_TOLERANCE})")
+    parser.add_argument("--output", type=Path, help="Also write this run's report to a file")
+    args = parser.parse_args()
+
+    load_dotenv()
+    neo4j_uri = os.getenv("NEO4J_URI")
+    neo4j_username = os.getenv("NEO4J_USERNAME")
+    neo4j_password = os.getenv("NEO4J_PASSWORD")
+    if not all([neo4j_uri, neo4j_username, neo4j_password]):
+        logger.error("Required: NEO4J_URI, NEO4J_USERNAME, NEO4J_PASSWORD")
+        sys.exit(1)
+
+    data_dir = Path(__file__).parent.parent / "data"
+    write_parameters = sample_parameters(data_dir)
+
+    driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_username, neo4j_password))
+    try:
+        report = capture_plans(driver, write_parameters, args.runs)
+    finally:
+        driver.close()
+
+    log_report(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    baseline: Optional[Dict[str, dict]] = None
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.tolerance)
+        for regression in regressions:
+            logger.warning(f"Regression: {regression}")
+        if not regressions:
+            logger.info(f"No regressions against {args.baseline}")
+        if args.check and regressions:
+            sys.exit(1)
+    elif args.check:
+        logger.error(f"No baseline at {args.baseline}; record one with --save-baseline and commit it")
+        sys.exit(1)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        logger.info(f"Saved baseline to {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Batch fuzzy resolution of person names to Person ULIDs.
+
+Matches names as they appear in bill authorship lists, vote tallies and the
+like ("AQUINO III, Benigno Simeon C.", "Sen. Bato dela Rosa") against every
+person's first/middle/last name, suffix and aliases.
+
+Each person contributes a few normalised name keys. Keys are grouped into
+blocks by the phonetic code (Soundex) of each last-name token; incoming names
+are grouped by the code of their own last name and each group is scored
+against its block in one vectorized `rapidfuzz.process.cdist` call. Names that
+find nothing good in their block are re-scored against every key.
+
+Usage:
+    python resolve_names.py names.txt                          # One name per line
+    python resolve_names.py names.txt --congress 19 --chamber house
+    python resolve_names.py --duplicates                       # Likely duplicate person files
+"""
+
+import argparse
+import logging
+import re
+import sys
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from loader import Dataset
+from snapshot import load_dataset_cached
+from transform import full_name
+
+logger = logging.getLogger(__name__)
+
+# Tokens dropped from names before matching
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v", "vi"}
+NAME_TITLES = {"sen", "senator", "rep", "representative", "cong", "congressman",
+               "congresswoman", "hon", "atty", "dr", "gov", "mayor", "engr"}
+
+# Scores are 0-100
+DEFAULT_CUTOFF = 85.0
+# A runner-up (different person) within this many points makes a match ambiguous
+AMBIGUITY_MARGIN = 3.0
+
+
+@dataclass
+class NameMatch:
+    """Best match for one input name."""
+
+    query: str
+    person_id: Optional[str]
+    score: float
+    matched_key: str = ""
+    ambiguous: bool = False
+    # Other (person_id, score) candidates above the cutoff, best first
+    alternatives: List[tuple] = field(default_factory=list)
+
+
+def normalize_name(name: str, drop_suffix: bool = True) -> str:
+    """Lowercase, strip accents and punctuation, and put "Last, First" in natural order."""
+    name = unicodedata.normalize("NFKD", str(name))
+    name = "".join(ch for ch in name if not unicodedata.combining(ch)).casefold()
+
+    if "," in name:
+        last, _, rest = name.partition(",")
+        name = f"{rest} {last}"
+
+    tokens = re.sub(r"[^\w\s]", " ", name).split()
+    tokens = [t for t in tokens if t not in NAME_TITLES]
+    if drop_suffix:
+        tokens = [t for t in tokens if t not in NAME_SUFFIXES]
+    return " ".join(tokens)
+
+
+def soundex(token: str) -> str:
+    """Return the American Soundex code of a single word."""
+    codes = {c: str(d) for d, letters in enumerate(
+        ["aeiouyhw", "bfpv", "cgjkqsxz", "dt", "l", "mn", "r"]) for c in letters}
+    letters = [c for c in token.lower() if c in codes]
+    if not letters:
+        return ""
+
+    result = letters[0].upper()
+    previous = codes[letters[0]]
+    for c in letters[1:]:
+        code = codes[c]
+        if code != "0" and code != previous:
+            result += code
+        if c not in "hw":
+            previous = code
+    return (result + "000")[:4]
+
+
+def _last_name_code(normalized: str) -> str:
+    """Blocking code of a normalised name: Soundex of its last token."""
+    tokens = normalized.split()
+    return soundex(tokens[-1]) if tokens else ""
+
+
+def person_name_keys(person: dict) -> List[str]:
+    """Build the normalised name variants a person can be referred to by."""
+    first = person.get("first_name", "")
+    middle = person.get("middle_name", "")
+    last = person.get("last_name", "")
+
+    variants = [f"{first} {last}", f"{first} {middle} {last}"]
+    if middle:
+        variants.append(f"{first} {middle[0]} {last}")
+    for alias in person.get("aliases", []):
+        variants.append(f"{alias} {last}")
+        variants.append(alias)
+
+    keys = []
+    for variant in variants:
+        key = normalize_name(variant)
+        if key and key not in keys:
+            keys.append(key)
+    return keys
+
+
+class NameResolver:
+    """Fuzzy name -> Person resolver over a loaded dataset."""
+
+    def __init__(self, dataset: Dataset, scorer=fuzz.WRatio):
+        """Precompute name keys, blocking index and membership filters."""
+        self.scorer = scorer
+        self.persons: Dict[str, dict] = {p["id"]: p for p in dataset.persons}
+
+        keys: List[str] = []
+        key_persons: List[str] = []
+        blocks: Dict[str, List[int]] = defaultdict(list)
+        for person in dataset.persons:
+            last_codes = {soundex(t) for t in normalize_name(person.get("last_name", "")).split()}
+            for key in person_name_keys(person):
+                key_idx = len(keys)
+                keys.append(key)
+                key_persons.append(person["id"])
+                for code in last_codes | {_last_name_code(key)}:
+                    if code:
+                        blocks[code].append(key_idx)
+
+        self.keys = keys
+        self.key_persons = np.array(key_persons, dtype=object)
+        self.blocks = {code: np.array(idxs) for code, idxs in blocks.items()}
+
+        # (congress, subtype) -> person ids, for activity filters
+        self.active: Dict[tuple, Set[str]] = defaultdict(set)
+        for membership in dataset.memberships:
+            if membership["type"] == "chamber":
+                self.active[(membership["congress"], membership["subtype"])].add(membership["person_id"])
+
+    def _allowed_mask(self, congress: Optional[Union[int, Iterable[int]]],
+                      chamber: Optional[str]) -> Optional[np.ndarray]:
+        """Boolean mask over keys for people active in the given congresses/chamber."""
+        if congress is None and chamber is None:
+            return None
+
+        congresses = {congress} if isinstance(congress, int) else set(congress or [])
+        allowed: Set[str] = set()
+        for (c, subtype), person_ids in self.active.items():
+            if congresses and c not in congresses:
+                continue
+            if chamber and subtype != chamber:
+                continue
+            allowed |= person_ids
+        return np.array([person_id in allowed for person_id in self.key_persons], dtype=bool)
+
+    def _best_matches(self, query: str, scores: np.ndarray, key_idxs: np.ndarray,
+                      cutoff: float) -> NameMatch:
+        """Collapse one row of key scores into the best match per person."""
+        order = np.argsort(-scores, kind="stable")
+        best: Dict[str, tuple] = {}
+        for pos in order:
+            score = float(scores[pos])
+            if score < cutoff:
+                break
+            person_id = self.key_persons[key_idxs[pos]]
+            if person_id not in best:
+                best[person_id] = (score, self.keys[key_idxs[pos]])
+
+        if not best:
+            return NameMatch(query=query, person_id=None, score=0.0)
+
+        ranked = sorted(best.items(), key=lambda item: -item[1][0])
+        person_id, (score, key) = ranked[0]
+        alternatives = [(pid, s) for pid, (s, _) in ranked[1:]]
+        ambiguous = bool(alternatives) and score - alternatives[0][1] <= AMBIGUITY_MARGIN
+        return NameMatch(query=query, person_id=person_id, score=score, matched_key=key,
+                         ambiguous=ambiguous, alternatives=alternatives)
+
+    def resolve(self, names: List[str], congress: Optional[Union[int, Iterable[int]]] = None,
+                chamber: Optional[str] = None, cutoff: float = DEFAULT_CUTOFF) -> List[NameMatch]:
+        """Resolve many names at once, optionally only to people active in
+        the given congress(es) and chamber ('senate' or 'house')."""
+        mask = self._allowed_mask(congress, chamber)
+        normalized = [normalize_name(name) for name in names]
+        results: List[Optional[NameMatch]] = [None] * len(names)
+
+        # Score each block's queries against the block's keys in one call
+        groups: Dict[str, List[int]] = defaultdict(list)
+        for query_idx, query in enumerate(normalized):
+            groups[_last_name_code(query)].append(query_idx)
+
+        unresolved = []
+        for code, query_idxs in groups.items():
+            key_idxs = self.blocks.get(code)
+            if key_idxs is None or not code:
+                unresolved.extend(query_idxs)
+                continue
+            matrix = process.cdist([normalized[i] for i in query_idxs],
+                                   [self.keys[k] for k in key_idxs],
+                                   scorer=self.scorer, workers=-1)
+            if mask is not None:
+                matrix[:, ~mask[key_idxs]] = 0
+            for row, query_idx in enumerate(query_idxs):
+                match = self._best_matches(names[query_idx], matrix[row], key_idxs, cutoff)
+                if match.person_id:
+                    results[query_idx] = match
+                else:
+                    unresolved.append(query_idx)
+
+        # Fall back to scoring leftovers against every key
+        if unresolved:
+            all_idxs = np.arange(len(self.keys))
+            matrix = process.cdist([normalized[i] for i in unresolved], self.keys,
+                                   scorer=self.scorer, workers=-1)
+            if mask is not None:
+                matrix[:, ~mask] = 0
+            for row, query_idx in enumerate(unresolved):
+                results[query_idx] = self._best_matches(names[query_idx], matrix[row], all_idxs, cutoff)
+
+        return results
+
+    def find_duplicates(self, threshold: float = 92.0) -> List[tuple]:
+        """Find pairs of person files that likely describe the same person.
+
+        Compares full names (suffix included, so a "Jr" and his father don't
+        pair up) within each last-name block. Returns (id_a, id_b, score) tuples,
+        best first.
+        """
+        ids = list(self.persons)
+        names = [normalize_name(full_name(self.persons[pid]), drop_suffix=False) for pid in ids]
+
+        blocks: Dict[str, List[int]] = defaultdict(list)
+        for idx, pid in enumerate(ids):
+            for token in normalize_name(self.persons[pid].get("last_name", "")).split():
+                blocks[soundex(token)].append(idx)
+
+        pairs: Dict[tuple, float] = {}
+        for idxs in blocks.values():
+            if len(idxs) < 2:
+                continue
+            block_names = [names[i] for i in idxs]
+            matrix = process.cdist(block_names, block_names, scorer=fuzz.token_sort_ratio, workers=-1)
+            rows, cols = np.nonzero(np.triu(matrix >= threshold, k=1))
+            for row, col in zip(rows, cols):
+                pair = tuple(sorted((ids[idxs[row]], ids[idxs[col]])))
+                pairs[pair] = max(pairs.get(pair, 0.0), float(matrix[row, col]))
+
+        return sorted(((a, b, score) for (a, b), score in pairs.items()), key=lambda p: -p[2])
+
+
+def main():
+    """Resolve names from a file, or list likely duplicate person files."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    parser = argparse.ArgumentParser(description="Resolve person names to Person ULIDs.")
+    parser.add_argument("names_file", nargs="?", help="File with one name per line ('-' for stdin)")
+    parser.add_argument("--congress", type=int, action="append",
+                        help="Only match people active in this congress (repeatable)")
+    parser.add_argument("--chamber", choices=["senate", "house"],
+                        help="Only match people active in this chamber")
+    parser.add_argument("--cutoff", type=float, default=DEFAULT_CUTOFF, help="Minimum score (0-100)")
+    parser.add_argument("--duplicates", action="store_true", help="List likely duplicate person files")
+    args = parser.parse_args()
+
+    data_dir = Path(__file__).parent.parent / "data"
+    resolver = NameResolver(load_dataset_cached(data_dir))
+
+    if args.duplicates:
+        for id_a, id_b, score in resolver.find_duplicates():
+            print(f"{score:.1f}\t{id_a}\t{full_name(resolver.persons[id_a])}\t"
+                  f"{id_b}\t{full_name(resolver.persons[id_b])}")
+        return
+
+    if not args.names_file:
+        parser.error("a names file is required unless --duplicates is given")
+
+    stream = sys.stdin if args.names_file == "-" else open(args.names_file, encoding="utf-8")
+    with stream:
+        names = [line.strip() for line in stream if line.strip()]
+
+    matches = resolver.resolve(names, congress=args.congress, chamber=args.chamber, cutoff=args.cutoff)
+    unresolved = 0
+    for match in matches:
+        if match.person_id:
+            flag = "\tAMBIGUOUS" if match.ambiguous else ""
+            print(f"{match.query}\t{match.person_id}\t{match.score:.1f}\t"
+                  f"{full_name(resolver.persons[match.person_id])}{flag}")
+        else:
+            unresolved += 1
+            print(f"{match.query}\t\t0.0\t")
+
+    logger.info(f"Resolved {len(matches) - unresolved}/{len(matches)} names")
+
+
+if __name__ == "__main__":
+    main()
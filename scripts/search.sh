@@ -17,12 +17,23 @@ search_exact_id(){
 }
 
 search_partial_id(){
-    local search_id ="$1"
+    local search_id="$1"
     echo "Searching for the partial ID match: '$search_id'"
 
     # Search for files containing the ID
-    find "$DIRECTORY" -type f -name "${search_id}*" 2>dev>null 
-} 
+    find "$DIRECTORY" -type f -name "${search_id}*" 2>/dev/null
+}
+
+# Function to list all IDs (file names without extension)
+list_all_ids() {
+    find "$DIRECTORY" -type f -name "*.toml" 2>/dev/null | sed 's|.*/||; s|\.[^.]*$||' | sort
+}
+
+# Function to list IDs of files with a specific extension
+list_ids_by_extension() {
+    local extension="${1#.}"
+    find "$DIRECTORY" -type f -name "*.${extension}" 2>/dev/null | sed 's|.*/||; s|\.[^.]*$||' | sort
+}
 
 # Function to get file details
 get_file_details() {
@@ -90,6 +101,9 @@ main() {
             echo "  $0 partial B001"
             echo "  $0 ext csv"
             echo "  $0 list"
+            echo ""
+            echo "For lookups by website keys, names, aliases or chamber rosters, use:"
+            echo "  python scripts/lookup.py"
             ;;
     esac
 }
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Compiled on-disk snapshot of the Philippine Congress dataset.
+
+Compiles every entity file under `data/` into a single binary file that stores
+each entity table column-wise, plus an id -> row index per table. The snapshot
+is memory-mapped on load and columns are only decoded when they are read, so
+tools that touch a couple of columns never pay for the rest.
+
+The snapshot records the mtime, size and content hash of every source file.
+It is fresh while every file still matches on mtime and size; recompiling only
+re-parses files whose content hash changed.
+
+File layout:
+    MAGIC (8 bytes) | header length (8 bytes, little endian) | JSON header | column blobs
+
+Column blobs are pickled lists. The snapshot is a local cache built from the
+TOML files in this repository, so it should never be loaded from elsewhere.
+
+Usage:
+    python snapshot.py compile    # Compile (or refresh) the snapshot
+    python snapshot.py status     # Report whether the snapshot is fresh
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pickle
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from loader import ENTITY_DIRS, Dataset, flatten_memberships, list_entity_files, parse_files
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"OCDSNAP1"
+FORMAT_VERSION = 1
+
+# Entity type -> snapshot table (memberships are derived from persons)
+ENTITY_TABLES = {
+    "congress": "congresses",
+    "chamber": "chambers",
+    "committee": "committees",
+    "person": "persons",
+}
+MEMBERSHIP_COLUMNS = ["person_id", "type", "subtype", "congress", "position"]
+
+# Per-row bookkeeping column holding the source file (relative to the data root)
+SOURCE_COLUMN = "_source"
+
+DEFAULT_SNAPSHOT_PATH = Path(__file__).parent.parent / ".cache" / "snapshot.bin"
+
+
+def _file_hash(file_path: Path) -> str:
+    """Return the SHA-256 of a file's contents."""
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def _current_files(data_dir: Path) -> Dict[str, tuple]:
+    """Map each entity file (relative to the data root) to (entity, path, stat)."""
+    files = {}
+    for entity in ENTITY_DIRS:
+        for file_path in list_entity_files(data_dir, entity):
+            files[file_path.relative_to(data_dir).as_posix()] = (entity, file_path, file_path.stat())
+    return files
+
+
+class Snapshot:
+    """Read-only, memory-mapped view of a compiled snapshot."""
+
+    def __init__(self, path: Path):
+        """Open and memory-map a snapshot file."""
+        self.path = path
+        self._columns: Dict[tuple, list] = {}
+        self._indexes: Dict[str, Dict[str, int]] = {}
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            self._file.close()
+            raise ValueError(f"Not a snapshot file: {path}")
+
+        try:
+            self._read_header()
+        except Exception:
+            self.close()
+            raise
+
+    def _read_header(self):
+        """Parse and check the header; raises ValueError on a corrupt or foreign file."""
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a snapshot file: {self.path}")
+        try:
+            (header_length,) = struct.unpack_from("<Q", self._mmap, len(MAGIC))
+        except struct.error:
+            raise ValueError(f"Truncated snapshot header: {self.path}")
+        header_start = len(MAGIC) + 8
+        self.header = json.loads(self._mmap[header_start:header_start + header_length])
+        if not isinstance(self.header, dict):
+            raise ValueError(f"Not a snapshot file: {self.path}")
+        self._data_start = header_start + header_length
+        if self.header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {self.header.get('version')}")
+
+    def close(self):
+        """Release the memory map and file handle."""
+        self._columns.clear()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def files(self) -> Dict[str, list]:
+        """Source file manifest: relative path -> [entity, mtime_ns, size, sha256]."""
+        return self.header["files"]
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        """Source files that failed to parse when the snapshot was compiled."""
+        return self.header["errors"]
+
+    @property
+    def tables(self) -> List[str]:
+        return list(self.header["tables"])
+
+    def columns(self, table: str) -> List[str]:
+        """List the columns stored for a table."""
+        return list(self.header["tables"][table]["columns"])
+
+    def row_count(self, table: str) -> int:
+        return self.header["tables"][table]["rows"]
+
+    def _read_blob(self, span: List[int]):
+        offset, length = span
+        start = self._data_start + offset
+        return pickle.loads(self._mmap[start:start + length])
+
+    def column(self, table: str, name: str) -> list:
+        """Return a column's values, one per row (None where the field is absent)."""
+        key = (table, name)
+        if key not in self._columns:
+            self._columns[key] = self._read_blob(self.header["tables"][table]["columns"][name])
+        return self._columns[key]
+
+    def index(self, table: str) -> Dict[str, int]:
+        """Return the id -> row index of a table."""
+        if table not in self._indexes:
+            self._indexes[table] = self._read_blob(self.header["tables"][table]["index"])
+        return self._indexes[table]
+
+    def row(self, table: str, row_idx: int) -> dict:
+        """Rebuild one row as a plain dict, leaving out absent fields."""
+        record = {}
+        for name in self.columns(table):
+            if name == SOURCE_COLUMN:
+                continue
+            value = self.column(table, name)[row_idx]
+            if value is not None:
+                record[name] = value
+        return record
+
+    def get(self, table: str, entity_id: str) -> Optional[dict]:
+        """Look up a row by id."""
+        row_idx = self.index(table).get(entity_id)
+        return None if row_idx is None else self.row(table, row_idx)
+
+    def records(self, table: str) -> List[dict]:
+        """Rebuild every row of a table as plain dicts."""
+        return [self.row(table, row_idx) for row_idx in range(self.row_count(table))]
+
+    def is_fresh(self, data_dir: Path) -> bool:
+        """Check (by mtime and size only) that no source file changed since compiling."""
+        current = _current_files(data_dir)
+        if current.keys() != self.files.keys():
+            return False
+        for rel_path, (_, _, stat) in current.items():
+            _, mtime_ns, size, _ = self.files[rel_path]
+            if stat.st_mtime_ns != mtime_ns or stat.st_size != size:
+                return False
+        return True
+
+    def to_dataset(self, data_dir: Path) -> Dataset:
+        """Rebuild the loader's Dataset from the snapshot."""
+        dataset = Dataset()
+        for table in ENTITY_TABLES.values():
+            records = self.records(table)
+            getattr(dataset, table).extend(records)
+            for record, source in zip(records, self.column(table, SOURCE_COLUMN)):
+                dataset.sources[record["id"]] = data_dir / source
+
+        # Memberships keep every key, even when a value is missing
+        columns = [self.column("memberships", name) for name in MEMBERSHIP_COLUMNS]
+        dataset.memberships = [dict(zip(MEMBERSHIP_COLUMNS, values)) for values in zip(*columns)]
+        dataset.errors = [(data_dir / rel_path, error) for rel_path, error in self.errors.items()]
+        return dataset
+
+
+def _write_snapshot(path: Path, files: Dict[str, list], errors: Dict[str, str],
+                    tables: Dict[str, List[dict]], extra_columns: Dict[str, List[str]]):
+    """Serialise tables column-wise and atomically replace the snapshot file."""
+    blobs = []
+    offset = 0
+
+    def add_blob(value) -> List[int]:
+        nonlocal offset
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        blobs.append(blob)
+        span = [offset, len(blob)]
+        offset += len(blob)
+        return span
+
+    table_headers = {}
+    for table, rows in tables.items():
+        names = list(dict.fromkeys(name for row in rows for name in row))
+        names += [name for name in extra_columns.get(table, []) if name not in names]
+        columns = {name: add_blob([row.get(name) for row in rows]) for name in names}
+        index = {row["id"]: row_idx for row_idx, row in enumerate(rows) if "id" in row}
+        table_headers[table] = {"rows": len(rows), "columns": columns, "index": add_blob(index)}
+
+    header = json.dumps({
+        "version": FORMAT_VERSION,
+        "compiled_at": time.time(),
+        "files": files,
+        "errors": errors,
+        "tables": table_headers,
+    }).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, path)
+
+
+def open_snapshot(snapshot_path: Path = DEFAULT_SNAPSHOT_PATH) -> Optional[Snapshot]:
+    """Open a snapshot if one exists and is readable."""
+    if not snapshot_path.exists():
+        return None
+    try:
+        return Snapshot(snapshot_path)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable snapshot {snapshot_path}: {e}")
+        return None
+
+
+def compile_snapshot(data_dir: Path, snapshot_path: Path = DEFAULT_SNAPSHOT_PATH,
+                     workers: Optional[int] = None) -> Dict[str, int]:
+    """Compile (or refresh) the snapshot, re-parsing only files that changed.
+
+    Returns counts of files reused from the previous snapshot and re-parsed.
+    """
+    start_time = time.time()
+    current = _current_files(data_dir)
+
+    # Rows of the previous snapshot, keyed by source file
+    previous_rows: Dict[str, dict] = {}
+    previous_files: Dict[str, list] = {}
+    previous_errors: Dict[str, str] = {}
+    snapshot = open_snapshot(snapshot_path)
+    if snapshot:
+        with snapshot:
+            previous_files = snapshot.files
+            previous_errors = snapshot.errors
+            for table in ENTITY_TABLES.values():
+                for row_idx, source in enumerate(snapshot.column(table, SOURCE_COLUMN)):
+                    previous_rows[source] = snapshot.row(table, row_idx)
+
+    files: Dict[str, list] = {}
+    errors: Dict[str, str] = {}
+    records: Dict[str, dict] = {}
+    to_parse = []
+    for rel_path, (entity, file_path, stat) in current.items():
+        previous = previous_files.get(rel_path)
+        if previous and previous[1:3] == [stat.st_mtime_ns, stat.st_size]:
+            sha256 = previous[3]
+        else:
+            sha256 = _file_hash(file_path)
+        files[rel_path] = [entity, stat.st_mtime_ns, stat.st_size, sha256]
+
+        if previous and previous[3] == sha256:
+            if rel_path in previous_rows:
+                records[rel_path] = previous_rows[rel_path]
+                continue
+            if rel_path in previous_errors:
+                errors[rel_path] = previous_errors[rel_path]
+                continue
+        to_parse.append(rel_path)
+
+    for file_path, data, error in parse_files([current[p][1] for p in to_parse], workers=workers):
+        rel_path = file_path.relative_to(data_dir).as_posix()
+        if error is None and "id" not in data:
+            error = "missing id"
+        if error is not None:
+            logger.error(f"Failed to load {file_path}: {error}")
+            errors[rel_path] = error
+        else:
+            records[rel_path] = data
+
+    tables: Dict[str, List[dict]] = {table: [] for table in ENTITY_TABLES.values()}
+    tables["memberships"] = []
+    for rel_path in sorted(records):
+        entity = files[rel_path][0]
+        record = records[rel_path]
+        tables[ENTITY_TABLES[entity]].append({**record, SOURCE_COLUMN: rel_path})
+        if entity == "person":
+            tables["memberships"].extend(flatten_memberships(record))
+
+    extra_columns = {table: [SOURCE_COLUMN] for table in ENTITY_TABLES.values()}
+    extra_columns["memberships"] = MEMBERSHIP_COLUMNS
+    _write_snapshot(snapshot_path, files, errors, tables, extra_columns)
+
+    counts = {"reused": len(current) - len(to_parse), "parsed": len(to_parse)}
+    logger.info(
+        f"Compiled snapshot {snapshot_path} in {time.time() - start_time:.2f}s "
+        f"({counts['parsed']} files parsed, {counts['reused']} reused)"
+    )
+    return counts
+
+
+def load_dataset_cached(data_dir: Path, snapshot_path: Path = DEFAULT_SNAPSHOT_PATH,
+                        workers: Optional[int] = None) -> Dataset:
+    """Load the dataset through the snapshot, refreshing it first if it is stale."""
+    snapshot = open_snapshot(snapshot_path)
+    if snapshot and not snapshot.is_fresh(data_dir):
+        snapshot.close()
+        snapshot = None
+
+    if snapshot is None:
+        compile_snapshot(data_dir, snapshot_path, workers=workers)
+        snapshot = Snapshot(snapshot_path)
+
+    with snapshot:
+        dataset = snapshot.to_dataset(data_dir)
+
+    logger.info(
+        f"Loaded {len(dataset.congresses)} congresses, {len(dataset.chambers)} chambers, "
+        f"{len(dataset.committees)} committees, {len(dataset.persons)} people "
+        f"({len(dataset.memberships)} memberships) from snapshot"
+    )
+    for file_path, error in dataset.errors:
+        logger.error(f"Failed to load {file_path}: {error}")
+    return dataset
+
+
+def main():
+    """Compile the snapshot or report its status."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    data_dir = Path(__file__).parent.parent / "data"
+    command = sys.argv[1] if len(sys.argv) > 1 else "compile"
+
+    if command == "compile":
+        compile_snapshot(data_dir)
+    elif command == "status":
+        snapshot = open_snapshot()
+        if snapshot is None:
+            logger.info(f"No snapshot at {DEFAULT_SNAPSHOT_PATH}")
+            sys.exit(1)
+        with snapshot:
+            fresh = snapshot.is_fresh(data_dir)
+            logger.info(f"Snapshot {snapshot.path}: {'fresh' if fresh else 'stale'}")
+            for table in snapshot.tables:
+                logger.info(f"  {table}: {snapshot.row_count(table)} rows, "
+                            f"{len(snapshot.columns(table))} columns")
+        sys.exit(0 if fresh else 1)
+    else:
+        logger.error(f"Unknown command: {command}")
+        logger.error("Usage: python snapshot.py [compile|status]")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
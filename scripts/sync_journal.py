@@ -0,0 +1,177 @@
+"""
+Checkpoint journal and dead-letter list for the Neo4j sync.
+
+The journal (`.cache/sync-journal.jsonl`) starts with a header naming the
+commit being synced and the sync mode, then gets one line per committed write transaction:
+entity type, batch index and the source files of the batch's records. It is
+flushed to disk as each line is written, so it survives a crash. When the
+sync completes, a final line marks the run as finished. `--resume` picks up an
+unfinished journal for the same commit and mode and skips the records it has
+already committed.
+
+The dead-letter list (`.cache/sync-dead-letters.json`) collects files that
+failed to parse or whose batch failed to write. A file leaves the list once a
+later run commits it. `--retry-dead-letters` syncs only the listed files.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from loader import ENTITY_DIRS
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_JOURNAL_PATH = PROJECT_ROOT / ".cache" / "sync-journal.jsonl"
+DEFAULT_DEAD_LETTER_PATH = PROJECT_ROOT / ".cache" / "sync-dead-letters.json"
+
+JOURNAL_VERSION = 1
+
+
+def entity_file(entity: str, entity_id: str) -> str:
+    """Source file of an entity, relative to the project root (files are named after their ULID)."""
+    return f"data/{ENTITY_DIRS[entity]}/{entity_id}.toml"
+
+
+def file_entity(file_path: Path) -> Optional[str]:
+    """Entity type of a data file, from the directory it is in."""
+    for entity, entity_dir in ENTITY_DIRS.items():
+        if file_path.parent.as_posix().endswith(f"data/{entity_dir}"):
+            return entity
+    return None
+
+
+class SyncJournal:
+    """Append-only record of the batches a sync run has committed."""
+
+    def __init__(self, path: Path = DEFAULT_JOURNAL_PATH):
+        self.path = path
+        # Entity type -> ids committed by this run (and, when resuming, the run it resumes)
+        self.committed: Dict[str, Set[str]] = defaultdict(set)
+        self.batches = 0
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _append(self, entry: dict):
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def start(self, commit: Optional[str], mode: str):
+        """Begin a new journal, replacing the previous one."""
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.committed.clear()
+        self.batches = 0
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._append({"version": JOURNAL_VERSION, "commit": commit, "mode": mode, "started": time.time()})
+
+    def resume(self, commit: Optional[str], mode: str) -> bool:
+        """Reopen an unfinished journal of `commit`; returns False if there is none to resume.
+
+        Raises ValueError if the unfinished run used another mode: an
+        incremental run on top of a partly written full sync would record the
+        commit as synced with most of the graph missing.
+        """
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+            header = json.loads(lines[0])
+        except (OSError, ValueError, IndexError):
+            return False
+        if header.get("version") != JOURNAL_VERSION or header.get("commit") != commit:
+            return False
+
+        committed = defaultdict(set)
+        batches = 0
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # A line cut short by a crash; its batch counts as not committed
+                continue
+            if entry.get("finished"):
+                return False
+            committed[entry["entity"]].update(Path(file_path).stem for file_path in entry["files"])
+            batches += 1
+
+        if header.get("mode") != mode:
+            raise ValueError(
+                f"The unfinished sync of this commit ran in {header.get('mode')} mode, not {mode}; "
+                "resume it with the same options"
+            )
+
+        self.close()
+        self.committed = committed
+        self.batches = batches
+        self._file = open(self.path, "a", encoding="utf-8")
+        return True
+
+    def record(self, checkpoint: dict):
+        """Record a committed batch: {"entity", "batch", "ids"}."""
+        with self._lock:
+            entity, ids = checkpoint["entity"], checkpoint["ids"]
+            # Without an open journal (e.g. when retrying dead letters) ids are only tracked
+            if self._file is not None:
+                self._append({
+                    "entity": entity,
+                    "batch": checkpoint["batch"],
+                    "files": [entity_file(entity, entity_id) for entity_id in ids],
+                    "time": time.time(),
+                })
+            self.committed[entity].update(ids)
+            self.batches += 1
+
+    def finish(self):
+        """Mark the run as complete, so it is never resumed."""
+        with self._lock:
+            if self._file is not None:
+                self._append({"finished": True, "time": time.time()})
+        self.close()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def load_dead_letters(path: Path = DEFAULT_DEAD_LETTER_PATH) -> List[dict]:
+    """Entries of the dead-letter list: {"entity", "file", "stage", "error"}."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))["files"]
+    except (OSError, ValueError, KeyError):
+        return []
+
+
+def update_dead_letters(committed: Dict[str, Set[str]], load_errors: List[Tuple[Path, str]],
+                        write_failures: List[dict],
+                        path: Path = DEFAULT_DEAD_LETTER_PATH) -> List[dict]:
+    """Drop committed files from the dead-letter list and add this run's failures.
+
+    `write_failures` are `PipelinedWriter.failures` entries; their checkpoint
+    names the batch's records. Returns the updated list.
+    """
+    entries = {
+        entry["file"]: entry for entry in load_dead_letters(path)
+        if Path(entry["file"]).stem not in committed.get(entry["entity"], set())
+    }
+    for file_path, error in load_errors:
+        entity = file_entity(file_path)
+        if entity:
+            relative = entity_file(entity, file_path.stem)
+            entries[relative] = {"entity": entity, "file": relative, "stage": "parse", "error": error}
+    for failure in write_failures:
+        checkpoint = failure.get("checkpoint")
+        for entity_id in (checkpoint or {}).get("ids", []):
+            relative = entity_file(checkpoint["entity"], entity_id)
+            entries[relative] = {"entity": checkpoint["entity"], "file": relative, "stage": "write",
+                                 "error": failure["error"]}
+
+    dead_letters = sorted(entries.values(), key=lambda entry: entry["file"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_text(json.dumps({"files": dead_letters}, indent=2) + "\n", encoding="utf-8")
+    os.replace(temp_path, path)
+    return dead_letters
@@ -0,0 +1,176 @@
+"""
+Metrics collected during a Neo4j sync.
+
+`SyncMetrics` aggregates the wall time, parameter rows and server-side result
+counters (nodes/relationships created, properties set, ...) of every Cypher
+statement, the wall time of every write transaction, and the duration of each
+sync stage. The result can be written as a JSON report and as a Prometheus
+textfile for node_exporter's textfile collector, to alert on slow runs or on
+fewer relationships than expected.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Optional
+
+# ResultSummary.counters fields that are recorded
+COUNTER_FIELDS = [
+    "nodes_created",
+    "nodes_deleted",
+    "relationships_created",
+    "relationships_deleted",
+    "properties_set",
+    "labels_added",
+    "labels_removed",
+]
+
+METRIC_PREFIX = "open_congress_sync"
+
+
+def _transaction_kind(description: str) -> str:
+    """Group batch descriptions such as "person batch 3" as "person batch"."""
+    return re.sub(r"\s+\d+$", "", description)
+
+
+class SyncMetrics:
+    """Thread-safe collector of statement, transaction and stage metrics."""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.statements: Dict[str, dict] = {}
+        self.transactions: Dict[str, dict] = {}
+        self.stages: Dict[str, float] = {}
+        # Free-form run details (mode, commit, status, expected and actual counts)
+        self.info: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def record_statement(self, name: str, seconds: float, rows: int = 0, counters=None):
+        """Record one executed statement; `counters` is a ResultSummary.counters."""
+        with self._lock:
+            stats = self.statements.setdefault(name, {
+                "executions": 0, "seconds_total": 0.0, "seconds_max": 0.0, "rows": 0,
+                **{field: 0 for field in COUNTER_FIELDS},
+            })
+            stats["executions"] += 1
+            stats["seconds_total"] += seconds
+            stats["seconds_max"] = max(stats["seconds_max"], seconds)
+            stats["rows"] += rows
+            if counters is not None:
+                for field in COUNTER_FIELDS:
+                    stats[field] += getattr(counters, field, 0)
+
+    def record_transaction(self, description: str, seconds: float, attempts: int, failed: bool):
+        """Record one write transaction, including its retries."""
+        with self._lock:
+            stats = self.transactions.setdefault(_transaction_kind(description), {
+                "count": 0, "seconds_total": 0.0, "seconds_max": 0.0, "retries": 0, "failed": 0,
+            })
+            stats["count"] += 1
+            stats["seconds_total"] += seconds
+            stats["seconds_max"] = max(stats["seconds_max"], seconds)
+            stats["retries"] += attempts - 1
+            stats["failed"] += int(failed)
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a stage of the sync (accumulates if entered more than once)."""
+        start = time.time()
+        try:
+            yield
+        finally:
+            elapsed = time.time() - start
+            with self._lock:
+                self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+    def counter_totals(self) -> Dict[str, int]:
+        """Server-side counters summed over all statements."""
+        with self._lock:
+            return {
+                field: sum(stats[field] for stats in self.statements.values())
+                for field in COUNTER_FIELDS
+            }
+
+    def finish(self):
+        """Mark the end of the run."""
+        self.finished_at = time.time()
+
+    def to_dict(self) -> dict:
+        """The full report as plain data."""
+        finished_at = self.finished_at or time.time()
+        with self._lock:
+            statements = {name: dict(stats) for name, stats in self.statements.items()}
+            transactions = {kind: dict(stats) for kind, stats in self.transactions.items()}
+            stages = dict(self.stages)
+        return {
+            **self.info,
+            "started_at": self.started_at,
+            "finished_at": finished_at,
+            "duration_seconds": round(finished_at - self.started_at, 3),
+            "stages": {name: round(seconds, 3) for name, seconds in stages.items()},
+            "counters": self.counter_totals(),
+            "statements": statements,
+            "transactions": transactions,
+        }
+
+    def write_json(self, path: Path):
+        """Write the report as JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2, default=str) + "\n", encoding="utf-8")
+
+    def write_prometheus(self, path: Path):
+        """Write the report in the Prometheus text format.
+
+        The file is replaced atomically so the textfile collector never reads
+        a partial file.
+        """
+        report = self.to_dict()
+        lines = []
+
+        def metric(name: str, help_text: str, samples):
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} gauge")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{_escape_label(val)}"' for key, val in labels.items())
+                lines.append(f"{METRIC_PREFIX}_{name}{{{label_text}}} {value}" if label_text
+                             else f"{METRIC_PREFIX}_{name} {value}")
+
+        metric("success", "Whether the last sync completed successfully.",
+               [({}, int(report.get("status") == "success"))])
+        metric("last_run_timestamp_seconds", "When the last sync finished.",
+               [({}, round(report["finished_at"], 3))])
+        metric("duration_seconds", "Wall time of the last sync.",
+               [({}, report["duration_seconds"])])
+        metric("stage_duration_seconds", "Wall time of each sync stage.",
+               [({"stage": name}, seconds) for name, seconds in report["stages"].items()])
+        metric("statement_seconds", "Total wall time spent in each Cypher statement.",
+               [({"statement": name}, round(stats["seconds_total"], 6))
+                for name, stats in report["statements"].items()])
+        metric("statement_executions", "Executions of each Cypher statement.",
+               [({"statement": name}, stats["executions"]) for name, stats in report["statements"].items()])
+        metric("statement_rows", "Parameter rows sent with each Cypher statement.",
+               [({"statement": name}, stats["rows"]) for name, stats in report["statements"].items()])
+        metric("changes", "Server-side counters summed over all statements.",
+               [({"counter": field}, value) for field, value in report["counters"].items()])
+        metric("transactions", "Write transactions per batch kind.",
+               [({"batch": kind}, stats["count"]) for kind, stats in report["transactions"].items()])
+        metric("transaction_failures", "Write transactions that failed after retries.",
+               [({"batch": kind}, stats["failed"]) for kind, stats in report["transactions"].items()])
+        metric("expected", "Nodes and relationships submitted for writing.",
+               [({"item": item}, count) for item, count in report.get("expected", {}).items()])
+        metric("graph", "Nodes and relationships in the graph after the sync.",
+               [({"item": item}, count) for item, count in report.get("graph", {}).items()])
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        os.replace(temp_path, path)
+
+
+def _escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
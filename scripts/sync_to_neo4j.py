@@ -5,53 +5,220 @@ Optimized sync script for Philippine Congress data to Neo4j database.
 This version uses batch operations and transactions for much faster syncing.
 Performance improvements:
 - Batch UNWIND operations for multiple nodes at once
-- Single transaction per batch instead of per node
+- Single managed transaction per batch (nodes and relationships together)
+- Several batches written concurrently, fed by a bounded queue
 - Reduced network round trips
 
 Usage:
     python sync_to_neo4j.py                # Sync data without clearing
     python sync_to_neo4j.py --clear        # Clear database first (will prompt for confirmation)
     python sync_to_neo4j.py --clear --yes  # Clear database first (skip confirmation - for CI/CD)
+    python sync_to_neo4j.py --incremental  # Only sync files changed since the last synced commit
+    python sync_to_neo4j.py --staged       # Rebuild alongside the live graph, then swap atomically
+    python sync_to_neo4j.py --workers 8 --batch-size person=500  # Tune write concurrency and batching
+    python sync_to_neo4j.py --metrics-json sync.json --metrics-prom sync.prom  # Write run metrics
+    python sync_to_neo4j.py --skip-validation  # Sync without checking the data for broken references
+    python sync_to_neo4j.py --incremental --watch  # Sync, then keep syncing files as they are edited
+    python sync_to_neo4j.py --resume       # Finish a failed sync, skipping batches it committed
+    python sync_to_neo4j.py --retry-dead-letters  # Sync only files that failed to load or write
 """
 
+import argparse
 import os
 import sys
 import logging
+import subprocess
 import time
+from collections import Counter
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List
-import tomlkit
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from neo4j import GraphDatabase
 from neo4j.exceptions import Neo4jError
 from dotenv import load_dotenv
 
+from data_watcher import DEFAULT_DEBOUNCE, DataWatcher
+from loader import ENTITY_DIRS, iter_records, scan_chamber_mapping
+from neo4j_writer import PipelinedWriter
+from sync_journal import SyncJournal, load_dead_letters, update_dead_letters
+from sync_metrics import SyncMetrics
+from validate_data import log_report, validate
+from transform import (
+    chamber_congress_edge, chamber_node, committee_congress_edges, committee_node,
+    congress_node, person_chamber_edges, person_node,
+)
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Labels of the nodes this script owns
+NODE_LABELS = ["Congress", "Committee", "Person", "Group"]
+
+# A staged sync writes under "Staged<Label>" and retires the old graph as
+# "Retired<Label>" until it has been deleted
+STAGED_PREFIX = "Staged"
+RETIRED_PREFIX = "Retired"
+
+# Nodes deleted per transaction when removing old data
+DELETE_CHUNK_SIZE = 1000
+
+# Node label each entity type syncs to
+ENTITY_LABELS = {
+    "congress": "Congress",
+    "chamber": "Group",
+    "committee": "Committee",
+    "person": "Person",
+}
+
+# Records per write transaction, per entity type
+DEFAULT_BATCH_SIZES = {
+    "congress": 500,
+    "chamber": 500,
+    "committee": 200,
+    "person": 200,
+}
+
+# Concurrent write transactions
+DEFAULT_WORKERS = 4
+
+# Identifier of the node that records which commit the graph was last synced from
+SYNC_STATE_ID = "open-congress-data"
+
+# Version of what the sync writes, recorded next to the synced commit. Bump it
+# whenever node properties or relationships change (e.g. in transform.py): an
+# incremental run only rewrites changed files, so it falls back to a full sync
+# when the graph was written by another version.
+#   1: first recorded version
+#   2: name_key leaves out the name prefix
+SYNC_VERSION = 2
+
+# Cypher of the batch writes, by the name their metrics are recorded under.
+# Node labels are placeholders ({Person}, ...), filled in by write_statement.
+WRITE_STATEMENTS = {
+    "congress nodes": """
+        UNWIND $batch AS congress
+        MERGE (c:{Congress} {{id: congress.id}})
+        SET c = congress
+    """,
+    "chamber nodes": """
+        UNWIND $batch AS chamber
+        MERGE (g:{Group} {{id: chamber.id}})
+        SET g = chamber
+    """,
+    "delete chamber congress edges": """
+        UNWIND $ids AS id
+        MATCH (g:{Group} {{id: id}})-[r:BELONGS_TO]->(:{Congress})
+        DELETE r
+    """,
+    "chamber congress edges": """
+        UNWIND $batch AS rel
+        MATCH (g:{Group} {{id: rel.chamber_id}})
+        MATCH (c:{Congress} {{id: rel.congress_id}})
+        MERGE (g)-[:BELONGS_TO]->(c)
+    """,
+    "committee nodes": """
+        UNWIND $batch AS committee
+        MERGE (c:{Committee} {{id: committee.id}})
+        SET c = committee
+    """,
+    "delete committee congress edges": """
+        UNWIND $ids AS id
+        MATCH (com:{Committee} {{id: id}})-[r:BELONGS_TO]->(:{Congress})
+        DELETE r
+    """,
+    "committee congress edges": """
+        UNWIND $batch AS rel
+        MATCH (com:{Committee} {{id: rel.committee_id}})
+        MATCH (con:{Congress} {{id: rel.congress_id}})
+        MERGE (com)-[:BELONGS_TO]->(con)
+    """,
+    "person nodes": """
+        UNWIND $batch AS person
+        MERGE (p:{Person} {{id: person.id}})
+        SET p = person
+    """,
+    "delete person chamber edges": """
+        UNWIND $ids AS id
+        MATCH (p:{Person} {{id: id}})-[r:MEMBER_OF]->(:{Group})
+        DELETE r
+    """,
+    "person chamber edges": """
+        UNWIND $batch AS rel
+        MATCH (p:{Person} {{id: rel.person_id}})
+        MATCH (g:{Group} {{id: rel.chamber_id}})
+        MERGE (p)-[r:MEMBER_OF]->(g)
+        SET r.position = rel.position
+    """,
+}
+
+
+def write_statement(name: str, labels: Optional[Dict[str, str]] = None) -> str:
+    """Cypher of a batch write, with the given node labels (default: the live labels)."""
+    labels = labels or {label: label for label in NODE_LABELS}
+    return WRITE_STATEMENTS[name].format(**labels)
+
 
 class Neo4jSyncerOptimized:
     """Optimized handler for syncing data to Neo4j database using batch operations."""
 
-    def __init__(self, uri: str, username: str, password: str):
-        """Initialize Neo4j connection."""
+    def __init__(self, uri: str, username: str, password: str,
+                 workers: int = DEFAULT_WORKERS, batch_sizes: Optional[Dict[str, int]] = None,
+                 driver=None, metrics: Optional[SyncMetrics] = None,
+                 journal: Optional[SyncJournal] = None):
+        """Initialize Neo4j connection and the pipelined writer.
+
+        An existing `driver` (e.g. a benchmark stand-in) is used instead of
+        connecting to `uri`. Every statement and transaction is recorded in
+        `metrics`, and every committed batch in `journal`.
+        """
         try:
-            self.driver = GraphDatabase.driver(uri, auth=(username, password))
+            self.driver = driver or GraphDatabase.driver(uri, auth=(username, password))
             self.driver.verify_connectivity()
             logger.info("Successfully connected to Neo4j")
         except Exception as e:
             logger.error(f"Failed to connect to Neo4j: {e}")
             raise
 
+        self.batch_sizes = {**DEFAULT_BATCH_SIZES, **(batch_sizes or {})}
+        self.metrics = metrics or SyncMetrics()
+        self.writer = PipelinedWriter(self.driver, workers=workers, max_pending=workers * 2,
+                                      metrics=self.metrics, journal=journal)
+
+        # Label written for each node label (switched to staged labels by use_staging)
+        self.labels = {label: label for label in NODE_LABELS}
+        # Nodes and relationships submitted for writing, to validate a staged sync
+        self.expected = Counter()
+
     def close(self):
-        """Close the Neo4j driver."""
+        """Finish outstanding writes and close the Neo4j driver."""
+        if self.writer:
+            self.writer.close()
         if self.driver:
             self.driver.close()
 
+    def _run(self, runner, name: str, query: str, **params) -> list:
+        """Run a statement in a session or transaction and record its metrics.
+
+        Returns the result records. `name` identifies the statement in the
+        metrics; list parameters count as the statement's rows.
+        """
+        start = time.time()
+        result = runner.run(query, **params)
+        records = list(result)
+        summary = result.consume()
+        rows = sum(len(value) for value in params.values() if isinstance(value, list))
+        self.metrics.record_statement(name, time.time() - start, rows, summary.counters)
+        return records
+
+    def _write(self, tx, name: str, **params) -> list:
+        """Run one of WRITE_STATEMENTS with the labels this sync writes (live or staged)."""
+        return self._run(tx, name, write_statement(name, self.labels), **params)
+
     def clear_database(self, skip_confirmation=False):
         """Clear specific node types and their relationships from the database."""
-        node_labels_to_clear = ["Congress", "Committee", "Person", "Group"]
+        node_labels_to_clear = NODE_LABELS
 
         with self.driver.session() as session:
             try:
@@ -62,8 +229,7 @@ class Neo4jSyncerOptimized:
                 count_query = (
                     f"MATCH (n) WHERE {label_conditions} RETURN count(n) as count"
                 )
-                result = session.run(count_query)
-                node_count = result.single()["count"]
+                node_count = self._run(session, "count nodes to clear", count_query)[0]["count"]
 
                 if node_count > 0:
                     logger.info(
@@ -79,16 +245,18 @@ class Neo4jSyncerOptimized:
                         )
 
                     if response.lower() == "yes":
-                        delete_query = (
-                            f"MATCH (n) WHERE {label_conditions} DETACH DELETE n"
-                        )
-                        session.run(delete_query)
+                        # Forget the synced commit first: if the clear or the rebuild
+                        # fails, an incremental run must not diff against it
+                        self.clear_last_synced_commit()
+                        for label in node_labels_to_clear:
+                            self._delete_label_in_chunks(label)
                         logger.info(
                             f"Cleared {node_count} nodes of types: {', '.join(node_labels_to_clear)}"
                         )
                     else:
                         logger.info("Clear operation cancelled")
                 else:
+                    self.clear_last_synced_commit()
                     logger.info(
                         f"No nodes found with labels: {', '.join(node_labels_to_clear)}"
                     )
@@ -96,295 +264,515 @@ class Neo4jSyncerOptimized:
                 logger.error(f"Failed to clear database: {e}")
                 raise
 
-    def sync_congresses_batch(self, congresses_dir: Path) -> Dict[int, str]:
-        """Sync congress data to Neo4j using batch operations."""
-        congress_mapping = {}
-        congress_batch = []
+    def sync_congresses_batch(self, congresses: Iterable[dict]) -> Dict[int, str]:
+        """Sync congress data to Neo4j using batch operations.
 
-        congress_files = sorted(congresses_dir.glob("*.toml"))
-        logger.info(f"Found {len(congress_files)} congress files")
+        Congresses are always synced in full: there are only a handful of them
+        and every other entity needs the complete congress number -> id mapping.
+        """
+        congresses = list(congresses)
+        logger.info(f"Found {len(congresses)} congresses")
+        congress_mapping = {c["congress_number"]: c["id"] for c in congresses}
 
-        # Load all congress data
-        for file_path in congress_files:
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = tomlkit.load(f)
-                    congress_mapping[data["congress_number"]] = data["id"]
-                    congress_batch.append(dict(data))
-            except Exception as e:
-                logger.error(f"Failed to load {file_path}: {e}")
-
-        # Batch insert all congresses in a single transaction
-        if congress_batch:
-            with self.driver.session() as session:
-                query = """
-                UNWIND $batch AS congress
-                MERGE (c:Congress {id: congress.id})
-                SET c = congress
-                """
-                session.run(query, batch=congress_batch)
-                logger.info(f"Successfully synced {len(congress_batch)} congresses in batch")
+        for batch_idx, records in enumerate(_batched(congresses, self.batch_sizes["congress"]), 1):
+            batch = [congress_node(congress) for congress in records]
+            self.expected["Congress"] += len(batch)
+            self.writer.submit(f"congress batch {batch_idx}", self._write_congresses, batch,
+                               checkpoint=_checkpoint("congress", batch_idx, batch))
+        self.writer.flush()
+        logger.info(f"Successfully synced {len(congresses)} congresses")
 
         return congress_mapping
 
-    def sync_chambers_batch(self, chambers_dir: Path, congress_mapping: Dict[int, str]):
-        """Sync chamber (Group) data to Neo4j using batch operations."""
-        chamber_files = list(chambers_dir.glob("*.toml"))
-        # Filter out the mapping files
-        chamber_files = [f for f in chamber_files if not f.name.startswith('.')]
-        total_files = len(chamber_files)
-        logger.info(f"Found {total_files} chamber files")
-
-        chambers_batch = []
-        relationships_batch = []
-
-        for file_path in sorted(chamber_files):
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = tomlkit.load(f)
-
-                    # Add Group label to chamber data
-                    chamber_data = dict(data)
-                    chambers_batch.append(chamber_data)
-
-                    # Create relationship to congress
-                    if data.get("congress") and data["congress"] in congress_mapping:
-                        relationships_batch.append({
-                            "chamber_id": data["id"],
-                            "congress_id": congress_mapping[data["congress"]]
-                        })
-
-            except Exception as e:
-                logger.error(f"Failed to load {file_path}: {e}")
-
-        # Batch insert all chambers in a single transaction
-        if chambers_batch:
-            with self.driver.session() as session:
-                # Create Group nodes with chamber data
-                chamber_query = """
-                UNWIND $batch AS chamber
-                MERGE (g:Group {id: chamber.id})
-                SET g = chamber
-                """
-                session.run(chamber_query, batch=chambers_batch)
-                logger.info(f"Successfully synced {len(chambers_batch)} chambers")
-
-                # Create relationships to Congress
-                if relationships_batch:
-                    relationship_query = """
-                    UNWIND $batch AS rel
-                    MATCH (g:Group {id: rel.chamber_id})
-                    MATCH (c:Congress {id: rel.congress_id})
-                    MERGE (g)-[:BELONGS_TO]->(c)
-                    """
-                    session.run(relationship_query, batch=relationships_batch)
-                    logger.info(f"Created {len(relationships_batch)} chamber-congress relationships")
-
-    def sync_committees_batch(self, committees_dir: Path, congress_mapping: Dict[int, str]):
+    def _write_congresses(self, tx, congresses_batch: List[dict]):
+        """Transaction function: create/update a batch of congresses."""
+        self._write(tx, "congress nodes", batch=congresses_batch)
+
+    def sync_chambers_batch(self, chambers: Iterable[dict],
+                            congress_mapping: Dict[int, str]) -> Dict[Tuple[int, str], str]:
+        """Sync chamber (Group) data to Neo4j using batch operations.
+
+        Returns the (congress, subtype) -> id mapping of the synced chambers.
+        """
+        chamber_mapping = {}
+        total = 0
+
+        for batch_idx, records in enumerate(_batched(chambers, self.batch_sizes["chamber"]), 1):
+            batch = []
+            relationships_batch = []
+            for chamber in records:
+                chamber_mapping[(chamber.get("congress"), chamber.get("subtype"))] = chamber["id"]
+                batch.append(chamber_node(chamber))
+
+                # Create relationship to congress
+                edge = chamber_congress_edge(chamber, congress_mapping)
+                if edge:
+                    relationships_batch.append(edge)
+
+            total += len(batch)
+            self.expected["Group"] += len(batch)
+            self.expected["BELONGS_TO"] += len(relationships_batch)
+            self.writer.submit(f"chamber batch {batch_idx}", self._write_chambers,
+                               batch, relationships_batch,
+                               checkpoint=_checkpoint("chamber", batch_idx, batch))
+
+        self.writer.flush()
+        logger.info(f"Successfully synced {total} chambers")
+        return chamber_mapping
+
+    def _write_chambers(self, tx, chambers_batch: List[dict], relationships_batch: List[dict]):
+        """Transaction function: write a batch of chambers and their congress relationships."""
+        # Create Group nodes with chamber data
+        self._write(tx, "chamber nodes", batch=chambers_batch)
+
+        # Replace existing congress relationships so edits to `congress` take effect
+        self._write(tx, "delete chamber congress edges", ids=[chamber["id"] for chamber in chambers_batch])
+
+        # Create relationships to Congress
+        if relationships_batch:
+            self._write(tx, "chamber congress edges", batch=relationships_batch)
+
+    def sync_committees_batch(self, committees: Iterable[dict], congress_mapping: Dict[int, str]):
         """Sync committee data to Neo4j using batch operations."""
-        committee_files = list(committees_dir.glob("*.toml"))
-        total_files = len(committee_files)
-        logger.info(f"Found {total_files} committee files")
-
-        batch_size = 50  # Process 50 committees at a time
-        committees_batch = []
-        relationships_batch = []
-
-        for idx, file_path in enumerate(sorted(committee_files), 1):
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = tomlkit.load(f)
-
-                    # Prepare committee data (exclude congresses field)
-                    committee_data = {k: v for k, v in data.items() if k != "congresses"}
-                    committees_batch.append(committee_data)
-
-                    # Prepare relationship data
-                    for congress_num in data.get("congresses", []):
-                        if congress_num in congress_mapping:
-                            relationships_batch.append({
-                                "committee_id": data["id"],
-                                "congress_id": congress_mapping[congress_num]
-                            })
-
-                # Process batch when it reaches the size limit or at the end
-                if len(committees_batch) >= batch_size or idx == total_files:
-                    self._process_committee_batch(committees_batch, relationships_batch)
-
-                    logger.info(f"Progress: {idx}/{total_files} committees synced")
-                    committees_batch = []
-                    relationships_batch = []
-
-            except Exception as e:
-                logger.error(f"Failed to process {file_path.name}: {e}")
-
-    def _process_committee_batch(self, committees_batch: List[dict], relationships_batch: List[dict]):
-        """Process a batch of committees and their relationships."""
-        if not committees_batch:
-            return
+        total = 0
+
+        for batch_idx, batch in enumerate(_batched(committees, self.batch_sizes["committee"]), 1):
+            committees_batch = []
+            relationships_batch = []
+            for committee in batch:
+                # Prepare committee data (exclude congresses field) and relationship data
+                committees_batch.append(committee_node(committee))
+                relationships_batch.extend(committee_congress_edges(committee, congress_mapping))
+
+            total += len(batch)
+            self.expected["Committee"] += len(batch)
+            self.expected["BELONGS_TO"] += len(relationships_batch)
+            self.writer.submit(f"committee batch {batch_idx}", self._write_committees,
+                               committees_batch, relationships_batch,
+                               checkpoint=_checkpoint("committee", batch_idx, committees_batch))
+            logger.info(f"Progress: {total} committees queued")
+
+        self.writer.flush()
+        logger.info(f"Successfully synced {total} committees")
+
+    def _write_committees(self, tx, committees_batch: List[dict], relationships_batch: List[dict]):
+        """Transaction function: write a batch of committees and their relationships."""
+        # Batch create/update committees
+        self._write(tx, "committee nodes", batch=committees_batch)
+
+        # Drop existing congress relationships so removed congresses don't linger
+        self._write(tx, "delete committee congress edges", ids=[committee["id"] for committee in committees_batch])
+
+        # Batch create relationships
+        if relationships_batch:
+            self._write(tx, "committee congress edges", batch=relationships_batch)
+
+    def sync_people_batch(self, persons: Iterable[dict], chamber_mapping: Dict[Tuple[int, str], str]):
+        """Sync person data to Neo4j using batch operations.
+
+        Chamber memberships are resolved to chamber Group ids up front via
+        `chamber_mapping` ((congress, subtype) -> id), so every MEMBER_OF edge
+        is written with a single unique id lookup.
+        """
+        total = 0
+        unresolved = 0
+        start_time = time.time()
 
-        with self.driver.session() as session:
-            # Batch create/update committees
-            committee_query = """
-            UNWIND $batch AS committee
-            MERGE (c:Committee {id: committee.id})
-            SET c = committee
-            """
-            session.run(committee_query, batch=committees_batch)
-
-            # Batch create relationships
-            if relationships_batch:
-                relationship_query = """
-                UNWIND $batch AS rel
-                MATCH (com:Committee {id: rel.committee_id})
-                MATCH (con:Congress {id: rel.congress_id})
-                MERGE (com)-[:BELONGS_TO]->(con)
-                """
-                session.run(relationship_query, batch=relationships_batch)
+        for batch_idx, batch in enumerate(_batched(persons, self.batch_sizes["person"]), 1):
+            people_batch = []
+            relationships_batch = []
+            for person in batch:
+                # Prepare person data (exclude memberships and congresses)
+                people_batch.append(person_node(person))
+
+                # Only chamber memberships become relationships (to the chamber Group node)
+                edges, missing = person_chamber_edges(person, chamber_mapping)
+                relationships_batch.extend(edges)
+                unresolved += missing
+
+            total += len(batch)
+            self.expected["Person"] += len(batch)
+            self.expected["MEMBER_OF"] += len(relationships_batch)
+            self.writer.submit(f"person batch {batch_idx}", self._write_people,
+                               people_batch, relationships_batch,
+                               checkpoint=_checkpoint("person", batch_idx, people_batch))
+
+            elapsed = time.time() - start_time
+            rate = total / elapsed if elapsed > 0 else 0
+            logger.info(f"Progress: {total} people queued ({rate:.1f} people/sec)")
+
+        self.writer.flush()
+        if unresolved:
+            logger.warning(f"Skipped {unresolved} memberships that reference a missing chamber")
 
-    def sync_people_batch(self, people_dir: Path, congress_mapping: Dict[int, str]):
-        """Sync person data to Neo4j using batch operations."""
-        people_files = list(people_dir.glob("*.toml"))
-        total_files = len(people_files)
-        logger.info(f"Found {total_files} people files")
+        total_time = time.time() - start_time
+        logger.info(f"Successfully synced {total} people in {total_time:.1f} seconds")
 
-        batch_size = 50  # Process 50 people at a time
-        people_batch = []
-        relationships_batch = []
-        start_time = time.time()
+    def _write_people(self, tx, people_batch: List[dict], relationships_batch: List[dict]):
+        """Transaction function: write a batch of people and their chamber memberships."""
+        # Batch create/update people
+        self._write(tx, "person nodes", batch=people_batch)
 
-        for idx, file_path in enumerate(sorted(people_files), 1):
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = tomlkit.load(f)
-
-                    # Prepare person data (exclude memberships and congresses)
-                    person_data = {k: v for k, v in data.items() if k not in ["memberships", "congresses"]}
-                    people_batch.append(person_data)
-
-                    # Handle memberships structure - only create chamber relationships
-                    memberships = data.get("memberships", [])
-                    for membership in memberships:
-                        # For chamber memberships, create relationship to the chamber Group node
-                        if membership.get("type") == "chamber":
-                            congress_num = membership.get("congress")
-                            subtype = membership.get("subtype")  # 'house' or 'senate'
-
-                            if congress_num and subtype:
-                                relationships_batch.append({
-                                    "person_id": data["id"],
-                                    "congress": congress_num,
-                                    "subtype": subtype,
-                                    "type": "chamber",
-                                    "position": membership.get("position", "")
-                                })
-
-                # Process batch when it reaches the size limit or at the end
-                if len(people_batch) >= batch_size or idx == total_files:
-                    self._process_people_batch(people_batch, relationships_batch)
-
-                    elapsed = time.time() - start_time
-                    rate = idx / elapsed
-                    eta = (total_files - idx) / rate if rate > 0 else 0
-
-                    logger.info(f"Progress: {idx}/{total_files} people synced ({rate:.1f} people/sec, ETA: {eta:.0f}s)")
-                    people_batch = []
-                    relationships_batch = []
-
-            except Exception as e:
-                logger.error(f"Failed to process {file_path.name}: {e}")
+        # Drop existing chamber memberships so removed memberships don't linger
+        self._write(tx, "delete person chamber edges", ids=[person["id"] for person in people_batch])
 
-        total_time = time.time() - start_time
-        logger.info(f"Successfully synced people in {total_time:.1f} seconds")
+        # Create chamber relationships (Person -> Group)
+        if relationships_batch:
+            self._write(tx, "person chamber edges", batch=relationships_batch)
 
-    def _process_people_batch(self, people_batch: List[dict], relationships_batch: List[dict]):
-        """Process a batch of people and their relationships."""
-        if not people_batch:
+    def delete_entities(self, label: str, ids: List[str]):
+        """Delete nodes of the given label by id, together with their relationships."""
+        if not ids:
             return
 
         with self.driver.session() as session:
-            # Batch create/update people
-            people_query = """
-            UNWIND $batch AS person
-            MERGE (p:Person {id: person.id})
-            SET p = person
+            query = f"""
+            UNWIND $ids AS id
+            MATCH (n:{label} {{id: id}})
+            DETACH DELETE n
             """
-            session.run(people_query, batch=people_batch)
-
-            # Create chamber relationships (Person -> Group)
-            if relationships_batch:
-                chamber_query = """
-                UNWIND $batch AS rel
-                MATCH (p:Person {id: rel.person_id})
-                MATCH (g:Group {type: 'chamber', congress: rel.congress, subtype: rel.subtype})
-                MERGE (p)-[r:MEMBER_OF]->(g)
-                SET r.position = rel.position
+            self._run(session, f"delete {label} nodes", query, ids=ids)
+            logger.info(f"Deleted {len(ids)} {label} nodes for removed files")
+
+    def get_last_synced_commit(self) -> Tuple[Optional[str], Optional[int]]:
+        """Return the commit the graph was last synced from and the SYNC_VERSION that wrote it."""
+        with self.driver.session() as session:
+            records = self._run(
+                session, "get synced commit",
+                "MATCH (s:SyncState {id: $id}) RETURN s.commit as commit, s.version as version",
+                id=SYNC_STATE_ID,
+            )
+            return (records[0]["commit"], records[0]["version"]) if records else (None, None)
+
+    def set_last_synced_commit(self, commit: str):
+        """Record the commit the graph has just been synced from, with this SYNC_VERSION."""
+        with self.driver.session() as session:
+            self._run(
+                session, "set synced commit",
                 """
-                session.run(chamber_query, batch=relationships_batch)
+                MERGE (s:SyncState {id: $id})
+                SET s.commit = $commit, s.version = $version, s.synced_at = datetime()
+                """,
+                id=SYNC_STATE_ID,
+                commit=commit,
+                version=SYNC_VERSION,
+            )
+            logger.info(f"Recorded synced commit {commit[:12]} (sync version {SYNC_VERSION})")
+
+    def clear_last_synced_commit(self):
+        """Forget the synced commit, so the next incremental run falls back to a full sync."""
+        with self.driver.session() as session:
+            self._run(
+                session, "clear synced commit",
+                "MATCH (s:SyncState {id: $id}) DELETE s",
+                id=SYNC_STATE_ID,
+            )
 
     def create_indexes(self):
-        """Create indexes for better query performance."""
+        """Create uniqueness constraints on `id` and indexes for better query performance."""
+        unique_labels = NODE_LABELS + [STAGED_PREFIX + label for label in NODE_LABELS] + ["SyncState"]
+
         with self.driver.session() as session:
+            # Plain `id` indexes from older versions of this script block the
+            # uniqueness constraints (which bring their own index), so drop them
+            records = self._run(session, "show id indexes", """
+                SHOW INDEXES YIELD name, labelsOrTypes, properties, owningConstraint
+                WHERE owningConstraint IS NULL AND properties = ['id']
+                  AND labelsOrTypes[0] IN $labels
+                RETURN name
+            """, labels=unique_labels)
+            for record in records:
+                self._run(session, "drop index", f"DROP INDEX `{record['name']}` IF EXISTS")
+                logger.info(f"Dropped index {record['name']} in favour of a uniqueness constraint")
+
+            constraints = [
+                f"CREATE CONSTRAINT {label.lower()}_id IF NOT EXISTS "
+                f"FOR (n:{label}) REQUIRE n.id IS UNIQUE"
+                for label in unique_labels
+            ]
             indexes = [
-                "CREATE INDEX IF NOT EXISTS FOR (c:Congress) ON (c.id)",
                 "CREATE INDEX IF NOT EXISTS FOR (c:Congress) ON (c.congress_number)",
-                "CREATE INDEX IF NOT EXISTS FOR (com:Committee) ON (com.id)",
                 "CREATE INDEX IF NOT EXISTS FOR (com:Committee) ON (com.name)",
-                "CREATE INDEX IF NOT EXISTS FOR (p:Person) ON (p.id)",
                 "CREATE INDEX IF NOT EXISTS FOR (p:Person) ON (p.full_name)",
+                "CREATE INDEX IF NOT EXISTS FOR (p:Person) ON (p.name_key)",
                 "CREATE INDEX IF NOT EXISTS FOR (p:Person) ON (p.last_name)",
-                "CREATE INDEX IF NOT EXISTS FOR (g:Group) ON (g.id)",
                 "CREATE INDEX IF NOT EXISTS FOR (g:Group) ON (g.type)",
                 "CREATE INDEX IF NOT EXISTS FOR (g:Group) ON (g.congress)",
             ]
 
-            for index_query in indexes:
+            for index_query in constraints + indexes:
                 try:
-                    session.run(index_query)
+                    self._run(session, "create constraints and indexes", index_query)
                 except Exception as e:
                     logger.warning(f"Index creation warning: {e}")
 
-            logger.info("Database indexes created/verified")
+            logger.info("Database constraints and indexes created/verified")
 
     def get_statistics(self):
-        """Get statistics about the synced data."""
+        """Get statistics about the synced data (under the current labels), in one query."""
+        labels = self.labels
         with self.driver.session() as session:
-            stats = {}
+            records = self._run(session, "graph statistics", f"""
+            CALL {{ MATCH (n:{labels['Congress']}) RETURN count(n) AS congresses }}
+            CALL {{ MATCH (n:{labels['Committee']}) RETURN count(n) AS committees }}
+            CALL {{ MATCH (n:{labels['Person']}) RETURN count(n) AS persons }}
+            CALL {{ MATCH (n:{labels['Group']}) RETURN count(n) AS groups,
+                   count(CASE WHEN n.type = 'chamber' THEN n END) AS chambers }}
+            CALL {{ MATCH ()-[r:BELONGS_TO]->(:{labels['Congress']}) RETURN count(r) AS belongs_to }}
+            CALL {{
+                MATCH (:{labels['Person']})-[r:MEMBER_OF]->(g:{labels['Group']})
+                RETURN count(r) AS member_of,
+                       count(CASE WHEN g.type = 'chamber' AND g.subtype = 'senate' THEN r END) AS senate,
+                       count(CASE WHEN g.type = 'chamber' AND g.subtype = 'house' THEN r END) AS house
+            }}
+            RETURN congresses, committees, persons, groups, chambers, belongs_to, member_of, senate, house
+            """)
+            record = records[0]
+
+            return {
+                "Congress": record["congresses"],
+                "Committee": record["committees"],
+                "Person": record["persons"],
+                "Group": record["groups"],
+                "Chamber": record["chambers"],
+                "BELONGS_TO": record["belongs_to"],
+                "MEMBER_OF": record["member_of"],
+                "senate_memberships": record["senate"],
+                "house_memberships": record["house"],
+            }
+
+    def _delete_label_in_chunks(self, label: str):
+        """Delete all nodes of a label, DELETE_CHUNK_SIZE nodes per transaction."""
+        # CALL { ... } IN TRANSACTIONS needs an implicit (auto-commit) transaction
+        with self.driver.session() as session:
+            self._run(session, f"delete all {label} nodes", f"""
+            MATCH (n:{label})
+            CALL {{ WITH n DETACH DELETE n }} IN TRANSACTIONS OF {DELETE_CHUNK_SIZE} ROWS
+            """)
 
-            # Count nodes
-            for label in ["Congress", "Committee", "Person", "Group"]:
-                result = session.run(f"MATCH (n:{label}) RETURN count(n) as count")
-                stats[label] = result.single()["count"]
+    def use_staging(self):
+        """Write subsequent syncs under staged labels, invisible to readers."""
+        self.labels = {label: STAGED_PREFIX + label for label in NODE_LABELS}
+        self.expected = Counter()
+
+    def clear_staging(self):
+        """Remove leftover staged or retired nodes (e.g. from an interrupted run)."""
+        for label in NODE_LABELS:
+            for prefix in [STAGED_PREFIX, RETIRED_PREFIX]:
+                self._delete_label_in_chunks(prefix + label)
+
+    def validate_staging(self) -> List[str]:
+        """Compare the staged graph with what was submitted; returns a list of problems."""
+        stats = self.get_statistics()
+        problems = []
+        for key in NODE_LABELS + ["BELONGS_TO", "MEMBER_OF"]:
+            if stats[key] != self.expected[key]:
+                problems.append(f"{key}: expected {self.expected[key]}, staged {stats[key]}")
+        return problems
+
+    def promote_staging(self):
+        """Atomically swap the staged graph in for the live one, then delete the old graph.
+
+        Readers see either the old graph or the new one: relabelling happens in
+        a single transaction. The old nodes are deleted afterwards in chunks.
+        """
+        def swap(tx):
+            for label in NODE_LABELS:
+                self._run(tx, f"retire {label} nodes",
+                          f"MATCH (n:{label}) REMOVE n:{label} SET n:{RETIRED_PREFIX}{label}")
+                self._run(tx, f"promote {label} nodes",
+                          f"MATCH (n:{STAGED_PREFIX}{label}) REMOVE n:{STAGED_PREFIX}{label} SET n:{label}")
 
-            # Count chamber nodes specifically
-            result = session.run("MATCH (g:Group {type: 'chamber'}) RETURN count(g) as count")
-            stats["Chamber"] = result.single()["count"]
+        with self.driver.session() as session:
+            session.execute_write(swap)
+        self.labels = {label: label for label in NODE_LABELS}
+        logger.info("Promoted staged graph to live")
 
-            # Count relationships
-            for rel_type in ["BELONGS_TO", "MEMBER_OF"]:
-                result = session.run(
-                    f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count"
-                )
-                stats[rel_type] = result.single()["count"]
+        for label in NODE_LABELS:
+            self._delete_label_in_chunks(RETIRED_PREFIX + label)
+        logger.info("Deleted retired graph")
 
-            # Count chamber memberships by type
-            result = session.run("""
-                MATCH (p:Person)-[r:MEMBER_OF]->(g:Group {type: 'chamber', subtype: 'senate'})
-                RETURN count(DISTINCT r) as count
-            """)
-            stats["senate_memberships"] = result.single()["count"]
 
-            result = session.run("""
-                MATCH (p:Person)-[r:MEMBER_OF]->(g:Group {type: 'chamber', subtype: 'house'})
-                RETURN count(DISTINCT r) as count
-            """)
-            stats["house_memberships"] = result.single()["count"]
+def _batched(records: Iterable[dict], batch_size: int) -> Iterator[List[dict]]:
+    """Split a stream of records into lists of at most `batch_size`."""
+    iterator = iter(records)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _skip_ids(records: Iterable[dict], ids: Set[str]) -> Iterator[dict]:
+    """Stream the records whose id is not in `ids`."""
+    return (record for record in records if record["id"] not in ids)
+
+
+def _checkpoint(entity: str, batch_idx: int, batch: List[dict]) -> dict:
+    """Journal entry of a batch: which records it writes."""
+    return {"entity": entity, "batch": batch_idx, "ids": [record["id"] for record in batch]}
+
+
+def _parse_batch_size(value: str) -> Tuple[str, int]:
+    """Parse an ENTITY=SIZE command line value."""
+    entity, _, size = value.partition("=")
+    if entity not in DEFAULT_BATCH_SIZES or not size.isdigit() or int(size) < 1:
+        raise argparse.ArgumentTypeError(
+            f"expected ENTITY=SIZE with ENTITY one of {', '.join(DEFAULT_BATCH_SIZES)}"
+        )
+    return entity, int(size)
+
+
+def _git(project_root: Path, *args: str) -> Optional[str]:
+    """Run a git command in the project root and return its stdout, or None on failure."""
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(project_root), *args],
+            capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def get_head_commit(project_root: Path) -> Optional[str]:
+    """Return the commit currently checked out in the project root."""
+    return _git(project_root, "rev-parse", "HEAD")
+
+
+def get_changed_data_files(
+    project_root: Path, since_commit: str
+) -> Optional[Tuple[Dict[str, List[Path]], Dict[str, List[str]]]]:
+    """Find data files changed between `since_commit` and HEAD.
+
+    Returns a tuple of (changed files, deleted ids), each keyed by entity type
+    (see ENTITY_DIRS), or None if the diff can't be computed (e.g. the commit is
+    not in the local history).
+    """
+    if _git(project_root, "cat-file", "-e", f"{since_commit}^{{commit}}") is None:
+        return None
+
+    output = _git(
+        project_root, "diff", "--name-status", "--no-renames", since_commit, "HEAD", "--", "data"
+    )
+    if output is None:
+        return None
+
+    changed: Dict[str, List[Path]] = {entity: [] for entity in ENTITY_DIRS}
+    deleted: Dict[str, List[str]] = {entity: [] for entity in ENTITY_DIRS}
+
+    for line in output.splitlines():
+        status, rel_path = line.split("\t", 1)
+        path = Path(rel_path)
+        if path.suffix != ".toml" or path.name.startswith("."):
+            continue
+
+        for entity, entity_dir in ENTITY_DIRS.items():
+            if path.parent == Path("data") / entity_dir:
+                if status == "D":
+                    # Entity files are named after their ULID
+                    deleted[entity].append(path.stem)
+                else:
+                    changed[entity].append(project_root / path)
+                break
+
+    return changed, deleted
+
+
+def watch_and_sync(syncer: Neo4jSyncerOptimized, data_dir: Path, congress_mapping: Dict[int, str],
+                   chamber_mapping: Dict[Tuple[int, str], str], debounce: float = DEFAULT_DEBOUNCE):
+    """Keep syncing entity files as they are edited, until interrupted.
+
+    Each settled batch of edits goes through the same per-entity sync methods
+    as a full sync, so only the touched nodes and their edges are rewritten.
+    Congresses are resynced in full when one changes, as in every sync.
+    """
+    watcher = DataWatcher(data_dir, debounce=debounce)
+    logger.info(f"Watching {data_dir} for changes (debounce {debounce * 1000:.0f} ms, Ctrl+C to stop)")
+    try:
+        for changes in watcher.watch():
+            start = time.time()
+            load_errors = []
+
+            for entity in ["person", "committee", "chamber", "congress"]:
+                syncer.delete_entities(ENTITY_LABELS[entity], changes.deleted[entity])
+            deleted_chambers = set(changes.deleted["chamber"])
+            for key, chamber_id in list(chamber_mapping.items()):
+                if chamber_id in deleted_chambers:
+                    del chamber_mapping[key]
+
+            if changes.changed["congress"] or changes.deleted["congress"]:
+                congress_mapping = syncer.sync_congresses_batch(
+                    iter_records(data_dir, "congress", errors=load_errors)
+                )
+            if changes.changed["chamber"]:
+                chamber_mapping.update(syncer.sync_chambers_batch(
+                    iter_records(data_dir, "chamber", files=changes.changed["chamber"], errors=load_errors),
+                    congress_mapping,
+                ))
+            if changes.changed["committee"]:
+                syncer.sync_committees_batch(
+                    iter_records(data_dir, "committee", files=changes.changed["committee"], errors=load_errors),
+                    congress_mapping,
+                )
+            if changes.changed["person"]:
+                syncer.sync_people_batch(
+                    iter_records(data_dir, "person", files=changes.changed["person"], errors=load_errors),
+                    chamber_mapping,
+                )
 
-            return stats
+            # A file caught mid-save fails to parse; the next save syncs it
+            for failure in syncer.writer.failures:
+                logger.error(f"Failed to write {failure['batch']}: {failure['error']}")
+            syncer.writer.failures.clear()
+            changed = sum(len(files) for files in changes.changed.values())
+            deleted = sum(len(ids) for ids in changes.deleted.values())
+            logger.info(
+                f"Synced {changed - len(load_errors)} changed and {deleted} deleted files "
+                f"in {(time.time() - start) * 1000:.0f} ms"
+            )
+    except KeyboardInterrupt:
+        logger.info("Stopped watching")
 
 
 def main():
     """Main execution function."""
+    parser = argparse.ArgumentParser(description="Sync Philippine Congress data to Neo4j.")
+    parser.add_argument("--clear", action="store_true",
+                        help="Clear Congress/Committee/Person/Group nodes first")
+    parser.add_argument("--yes", action="store_true", help="Skip the --clear confirmation prompt")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only sync files changed since the last synced commit")
+    parser.add_argument("--staged", action="store_true",
+                        help="Rebuild under staging labels, validate, then swap with the live graph")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Concurrent write transactions (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--batch-size", type=_parse_batch_size, action="append", default=[],
+                        metavar="ENTITY=SIZE",
+                        help="Records per transaction for an entity type, e.g. person=500 (repeatable)")
+    parser.add_argument("--skip-validation", action="store_true",
+                        help="Don't check the data for broken references before syncing")
+    parser.add_argument("--metrics-json", type=Path, metavar="PATH",
+                        help="Write statement, transaction and stage metrics as JSON")
+    parser.add_argument("--metrics-prom", type=Path, metavar="PATH",
+                        help="Write metrics as a Prometheus textfile (for node_exporter)")
+    parser.add_argument("--watch", action="store_true",
+                        help="After syncing, keep the connection open and sync files as they are edited")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE, metavar="SECONDS",
+                        help=f"Quiet period before a burst of edits is synced (default: {DEFAULT_DEBOUNCE})")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an unfinished sync of the same commit, skipping committed batches")
+    parser.add_argument("--retry-dead-letters", action="store_true",
+                        help="Only sync the files of the dead-letter list")
+    args = parser.parse_args()
+    if args.watch and args.staged:
+        parser.error("--watch writes to the live graph and can't be combined with --staged")
+    if args.staged and (args.resume or args.retry_dead_letters):
+        parser.error("--staged always rebuilds from scratch; it can't be combined with "
+                     "--resume or --retry-dead-letters")
+    if args.retry_dead_letters and (args.resume or args.incremental or args.clear):
+        parser.error("--retry-dead-letters can't be combined with --resume, --incremental or --clear")
+
     load_dotenv()
 
     # Get configuration
@@ -419,12 +807,48 @@ def main():
 
     # Initialize syncer
     syncer = None
+    metrics = SyncMetrics()
+    journal = SyncJournal()
+    metrics.info["status"] = "failed"
     try:
-        syncer = Neo4jSyncerOptimized(neo4j_uri, neo4j_username, neo4j_password)
+        # Check references before any database work, so bad data can't half-write the graph
+        if not args.skip_validation:
+            with metrics.stage("validate data"):
+                report = validate(project_root / "data")
+            log_report(report)
+            metrics.info["validation"] = {"errors": len(report.errors), "warnings": len(report.warnings)}
+            if not report.valid:
+                metrics.info["status"] = "invalid"
+                logger.error("Data failed validation; nothing was synced (see scripts/validate_data.py)")
+                sys.exit(1)
+
+        syncer = Neo4jSyncerOptimized(
+            neo4j_uri, neo4j_username, neo4j_password,
+            workers=args.workers, batch_sizes=dict(args.batch_size), metrics=metrics, journal=journal,
+        )
 
-        # Parse command line arguments
-        clear_db = "--clear" in sys.argv
-        skip_confirmation = "--yes" in sys.argv
+        clear_db = args.clear
+        skip_confirmation = args.yes
+        incremental = args.incremental
+        staged = args.staged
+
+        if staged and (clear_db or incremental):
+            logger.warning("--staged always rebuilds alongside the live graph; ignoring --clear/--incremental")
+            clear_db = incremental = False
+
+        if clear_db and incremental:
+            logger.warning("--clear forces a full sync; ignoring --incremental")
+            incremental = False
+
+        # Resuming continues the journal of an unfinished run of the same commit and mode
+        head_commit = get_head_commit(project_root)
+        journal_mode = "staged" if staged else "incremental" if incremental else "full"
+        resumed = args.resume and journal.resume(head_commit, journal_mode)
+        if args.resume and not resumed:
+            logger.warning("No unfinished sync of this commit to resume; running a normal sync")
+        if resumed and clear_db:
+            logger.warning("--resume keeps what the last run wrote; ignoring --clear")
+            clear_db = False
 
         # Optional: Clear database
         if clear_db:
@@ -434,40 +858,178 @@ def main():
         logger.info("Creating database indexes...")
         syncer.create_indexes()
 
+        # A staged sync writes a complete new graph that readers can't see yet
+        if staged:
+            logger.info("Staged sync: writing new graph under staging labels")
+            syncer.clear_staging()
+            syncer.use_staging()
+
+        # Work out which files to sync when running incrementally
+        changed, deleted = None, None
+        if incremental:
+            last_commit, last_version = syncer.get_last_synced_commit()
+            diff = None
+            if not last_commit:
+                logger.warning("No previous sync recorded; falling back to full sync")
+            elif last_version != SYNC_VERSION:
+                logger.warning(
+                    f"Graph was written by sync version {last_version}, this is version {SYNC_VERSION}; "
+                    "falling back to full sync"
+                )
+            elif not head_commit:
+                logger.warning("Not a git checkout; falling back to full sync")
+            else:
+                diff = get_changed_data_files(project_root, last_commit)
+                if diff is None:
+                    logger.warning(
+                        f"Last synced commit {last_commit[:12]} not found in history; "
+                        "falling back to full sync"
+                    )
+
+            if diff is not None:
+                changed, deleted = diff
+                logger.info(
+                    f"Incremental sync from {last_commit[:12]} to {head_commit[:12]}: "
+                    f"{sum(len(files) for files in changed.values())} changed files, "
+                    f"{sum(len(ids) for ids in deleted.values())} deleted files"
+                )
+
+        # Retrying dead letters syncs just those files, like an incremental run
+        if args.retry_dead_letters:
+            dead_letters = [entry for entry in load_dead_letters() if (project_root / entry["file"]).exists()]
+            if not dead_letters:
+                logger.info("The dead-letter list is empty; nothing to retry")
+                metrics.info["status"] = "success"
+                return
+            changed = {entity: [] for entity in ENTITY_DIRS}
+            for entry in dead_letters:
+                changed[entry["entity"]].append(project_root / entry["file"])
+            logger.info(f"Retrying {len(dead_letters)} dead-letter files")
+
+        if args.retry_dead_letters:
+            metrics.info["mode"] = "retry"
+        else:
+            metrics.info["mode"] = "staged" if staged else "incremental" if changed is not None else "full"
+        metrics.info["commit"] = head_commit
+        metrics.info["resumed"] = bool(resumed)
+
+        # A retry only touches a few files, so it leaves the journal of the last run alone
+        if resumed:
+            logger.info(f"Resuming the last sync of this commit: {journal.batches} batches already committed")
+        elif not args.retry_dead_letters:
+            journal.start(head_commit, journal_mode)
+
         # Track total time
         total_start = time.time()
 
+        # Records are streamed through the parser a chunk at a time, so memory stays
+        # bounded. The compiled snapshot isn't used: its columns can only be decoded
+        # whole, which would hold the entire dataset in memory.
+        data_dir = project_root / "data"
+        load_errors = []
+        records = {
+            entity: iter_records(
+                data_dir, entity, errors=load_errors,
+                files=changed[entity] if changed and entity != "congress" else None,
+            )
+            for entity in ENTITY_DIRS
+        }
+
+        # Records the resumed run committed are already in the graph. Congresses are
+        # always rewritten, since every other entity needs the full congress mapping.
+        if resumed:
+            for entity in ["chamber", "committee", "person"]:
+                records[entity] = _skip_ids(records[entity], journal.committed[entity])
+
         # Sync data in order using batch operations
         logger.info("Starting optimized data sync...")
 
+        # 0. Remove entities whose files were deleted (people first, congresses last)
+        if deleted:
+            with metrics.stage("deletes"):
+                for entity in ["person", "committee", "chamber", "congress"]:
+                    syncer.delete_entities(ENTITY_LABELS[entity], deleted[entity])
+
         # 1. Sync Congresses first (they're referenced by committees and people)
         logger.info("Syncing congresses...")
-        congress_start = time.time()
-        congress_mapping = syncer.sync_congresses_batch(congresses_dir)
-        logger.info(f"Congress sync completed in {time.time() - congress_start:.1f}s")
-
-        # 2. Sync Chambers (Group nodes) if directory exists
+        with metrics.stage("congresses"):
+            congress_mapping = syncer.sync_congresses_batch(records["congress"])
+        logger.info(f"Congress sync completed in {metrics.stages['congresses']:.1f}s")
+
+        # 2. Sync Chambers (Group nodes) if directory exists. Chambers not synced
+        # this run (incremental, resumed) are resolved from their files, which
+        # unlike the mapping files list every chamber.
+        chamber_mapping = scan_chamber_mapping(data_dir)
         if chambers_dir:
             logger.info("Syncing chambers...")
-            chamber_start = time.time()
-            syncer.sync_chambers_batch(chambers_dir, congress_mapping)
-            logger.info(f"Chamber sync completed in {time.time() - chamber_start:.1f}s")
+            with metrics.stage("chambers"):
+                chamber_mapping.update(syncer.sync_chambers_batch(records["chamber"], congress_mapping))
+            logger.info(f"Chamber sync completed in {metrics.stages['chambers']:.1f}s")
 
         # 3. Sync Committees
         logger.info("Syncing committees...")
-        committee_start = time.time()
-        syncer.sync_committees_batch(committees_dir, congress_mapping)
-        logger.info(f"Committee sync completed in {time.time() - committee_start:.1f}s")
+        with metrics.stage("committees"):
+            syncer.sync_committees_batch(records["committee"], congress_mapping)
+        logger.info(f"Committee sync completed in {metrics.stages['committees']:.1f}s")
 
         # 4. Sync People
         logger.info("Syncing people...")
-        people_start = time.time()
-        syncer.sync_people_batch(people_dir, congress_mapping)
-        logger.info(f"People sync completed in {time.time() - people_start:.1f}s")
+        with metrics.stage("people"):
+            syncer.sync_people_batch(records["person"], chamber_mapping)
+        logger.info(f"People sync completed in {metrics.stages['people']:.1f}s")
+
+        if load_errors:
+            logger.warning(f"{len(load_errors)} files failed to load and were skipped")
+        metrics.info["load_errors"] = len(load_errors)
+        metrics.info["expected"] = dict(syncer.expected)
+
+        # Files that failed to load or write wait in the dead-letter list for a retry
+        dead_letters = update_dead_letters(journal.committed, load_errors, syncer.writer.failures)
+        metrics.info["dead_letters"] = len(dead_letters)
+        if dead_letters:
+            logger.warning(
+                f"{len(dead_letters)} files in the dead-letter list; retry them "
+                "with --retry-dead-letters once fixed"
+            )
+
+        # Batches that failed even after retries leave the graph incomplete:
+        # don't record the commit, so the next incremental run retries them
+        if syncer.writer.failures:
+            logger.error(f"{len(syncer.writer.failures)} batches failed to write:")
+            for failure in syncer.writer.failures:
+                logger.error(f"  - {failure['batch']}: {failure['error']}")
+            if not staged:
+                logger.error("Run again with --resume to write only what is missing")
+            if staged:
+                syncer.clear_staging()
+                logger.error("Discarded staged graph; the live graph was left untouched")
+            sys.exit(1)
+
+        # Only swap the staged graph in if it holds exactly what was written
+        if staged:
+            with metrics.stage("validate staging"):
+                problems = syncer.validate_staging()
+            if problems:
+                logger.error("Staged graph failed validation:")
+                for problem in problems:
+                    logger.error(f"  - {problem}")
+                syncer.clear_staging()
+                logger.error("Discarded staged graph; the live graph was left untouched")
+                sys.exit(1)
+            with metrics.stage("promote"):
+                syncer.promote_staging()
+
+        # Remember where we synced from so the next incremental run can diff against it.
+        # A retry only covers some files, so it doesn't count as a sync of the commit.
+        if head_commit and not args.retry_dead_letters:
+            syncer.set_last_synced_commit(head_commit)
+        journal.finish()
 
         # Display statistics
         stats = syncer.get_statistics()
         total_time = time.time() - total_start
+        metrics.info["graph"] = stats
+        metrics.info["status"] = "success"
 
         logger.info("\n=== Sync Complete ===")
         logger.info(f"Total sync time: {total_time:.1f} seconds")
@@ -480,12 +1042,25 @@ def main():
         logger.info(f"  - Senate memberships: {stats.get('senate_memberships', 0)}")
         logger.info(f"  - House memberships: {stats.get('house_memberships', 0)}")
 
+        # Edits synced while watching aren't committed, so the synced commit stays as is
+        if args.watch:
+            watch_and_sync(syncer, data_dir, congress_mapping, chamber_mapping, debounce=args.debounce)
+
     except Exception as e:
         logger.error(f"Sync failed: {e}")
         sys.exit(1)
     finally:
         if syncer:
             syncer.close()
+        journal.close()
+        metrics.finish()
+        try:
+            if args.metrics_json:
+                metrics.write_json(args.metrics_json)
+            if args.metrics_prom:
+                metrics.write_prometheus(args.metrics_prom)
+        except OSError as e:
+            logger.error(f"Failed to write metrics: {e}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Sync the dataset into an embedded SQLite database.
+
+An alternative target to Neo4j for jobs that only ask relational questions:
+the same records the graph sync prepares (see transform.py) become tables
+
+    congress, chamber, committee, person   one row per node, same properties
+    memberships                            person_id, type, subtype, congress,
+                                           position, chamber_id
+    committee_congress                     committee_id, congress, congress_id
+
+with indexes on the usual lookup columns. Array properties (website keys,
+aliases, congresses_served) are stored as JSON text, so they can be queried
+with SQLite's JSON functions.
+
+The database is built in a temporary file with one bulk-insert transaction
+and then moved into place, so readers never see a half-written database.
+
+Usage:
+    python sync_to_sqlite.py                  # Write build/congress.sqlite
+    python sync_to_sqlite.py <database file>  # Write another file
+
+Then, for example:
+    sqlite3 build/congress.sqlite "SELECT full_name FROM person WHERE last_name = 'Aquino'"
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from loader import Dataset
+from snapshot import load_dataset_cached
+from transform import (
+    chamber_congress_edge, chamber_node, committee_congress_edges, committee_node, congress_node, person_node,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATABASE = Path(__file__).parent.parent / "build" / "congress.sqlite"
+
+# Columns of the tables that aren't node property maps
+LINK_COLUMNS = {
+    "memberships": ["person_id", "type", "subtype", "congress", "position", "chamber_id"],
+    "committee_congress": ["committee_id", "congress", "congress_id"],
+}
+
+# Created after the bulk insert, which is faster than maintaining them row by row
+INDEXES = [
+    "CREATE UNIQUE INDEX congress_number ON congress (congress_number)",
+    "CREATE UNIQUE INDEX chamber_congress_subtype ON chamber (congress, subtype)",
+    "CREATE INDEX committee_name ON committee (name)",
+    "CREATE INDEX person_name_key ON person (name_key)",
+    "CREATE INDEX person_last_name ON person (last_name)",
+    "CREATE INDEX person_full_name ON person (full_name)",
+    "CREATE INDEX memberships_person ON memberships (person_id)",
+    "CREATE INDEX memberships_chamber ON memberships (chamber_id)",
+    "CREATE INDEX memberships_congress ON memberships (congress, subtype)",
+    "CREATE INDEX committee_congress_committee ON committee_congress (committee_id)",
+    "CREATE INDEX committee_congress_congress ON committee_congress (congress)",
+]
+
+
+def _column_type(values: List) -> str:
+    """SQLite column type for a column's (non-missing) values."""
+    types = {type(value) for value in values}
+    if types and types <= {int, bool}:
+        return "INTEGER"
+    if types and types <= {int, float}:
+        return "REAL"
+    return "TEXT"
+
+
+def _sql_value(value):
+    """Adapt a property value for SQLite: arrays become JSON text."""
+    if isinstance(value, list):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def build_tables(dataset: Dataset) -> Dict[str, Tuple[List[str], List[dict]]]:
+    """Prepare every table's columns and rows from a loaded dataset."""
+    congress_mapping = dataset.congress_mapping()
+    chamber_mapping = dataset.chamber_mapping()
+
+    chambers = []
+    for chamber in dataset.chambers:
+        edge = chamber_congress_edge(chamber, congress_mapping)
+        chambers.append({**chamber_node(chamber), "congress_id": edge["congress_id"] if edge else None})
+
+    nodes = {
+        "congress": [congress_node(c) for c in dataset.congresses],
+        "chamber": chambers,
+        "committee": [committee_node(c) for c in dataset.committees],
+        "person": [person_node(p) for p in dataset.persons],
+    }
+    tables = {}
+    for name, rows in nodes.items():
+        # id first, then properties in the order they first appear
+        columns = list(dict.fromkeys(["id"] + [key for row in rows for key in row]))
+        tables[name] = (columns, rows)
+
+    # Chamber memberships resolve to a chamber the same way MEMBER_OF edges do
+    tables["memberships"] = (LINK_COLUMNS["memberships"], [
+        {**membership, "chamber_id": chamber_mapping.get((membership["congress"], membership["subtype"]))
+         if membership["type"] == "chamber" else None}
+        for membership in dataset.memberships
+    ])
+    # One row per BELONGS_TO edge of the graph
+    congress_numbers = {congress_id: number for number, congress_id in congress_mapping.items()}
+    tables["committee_congress"] = (LINK_COLUMNS["committee_congress"], [
+        {**edge, "congress": congress_numbers[edge["congress_id"]]}
+        for committee in dataset.committees
+        for edge in committee_congress_edges(committee, congress_mapping)
+    ])
+    return tables
+
+
+def _create_table(conn: sqlite3.Connection, name: str, columns: List[str], rows: List[dict]):
+    """Create a table typed from its rows; node tables get `id` as primary key."""
+    definitions = []
+    for column in columns:
+        column_type = _column_type([row[column] for row in rows if row.get(column) is not None])
+        primary_key = " PRIMARY KEY" if column == "id" else ""
+        definitions.append(f'"{column}" {column_type}{primary_key}')
+    conn.execute(f'CREATE TABLE "{name}" ({", ".join(definitions)})')
+
+
+def sync_to_sqlite(dataset: Dataset, database: Path) -> Dict[str, int]:
+    """Write the dataset to a new SQLite database at `database`; returns row counts per table."""
+    tables = build_tables(dataset)
+    database.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = database.with_name(database.name + ".tmp")
+    if temp_path.exists():
+        temp_path.unlink()
+
+    conn = sqlite3.connect(temp_path)
+    try:
+        # The file is only moved into place once complete, so there is nothing to protect
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        counts = {}
+        with conn:
+            for name, (columns, rows) in tables.items():
+                _create_table(conn, name, columns, rows)
+                placeholders = ", ".join("?" for _ in columns)
+                quoted = ", ".join(f'"{column}"' for column in columns)
+                conn.executemany(
+                    f'INSERT INTO "{name}" ({quoted}) VALUES ({placeholders})',
+                    ([_sql_value(row.get(column)) for column in columns] for row in rows),
+                )
+                counts[name] = len(rows)
+            for statement in INDEXES:
+                conn.execute(statement)
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+    os.replace(temp_path, database)
+    return counts
+
+
+def main():
+    """Sync the dataset to SQLite."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    data_dir = Path(__file__).parent.parent / "data"
+    database = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DATABASE
+
+    dataset = load_dataset_cached(data_dir)
+    if dataset.errors:
+        logger.error(f"{len(dataset.errors)} files failed to load; refusing to write partial tables")
+        sys.exit(1)
+
+    counts = sync_to_sqlite(dataset, database)
+    for name, count in counts.items():
+        logger.info(f"Wrote {count} rows to {name}")
+    logger.info(f"Database written to {database}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic data trees shaped like `data/`, for benchmarking.
+
+At scale 1 the tree has about as many committees and people as the real
+dataset; scale N multiplies those (and so their memberships and committee
+congresses) by N. Congresses, chambers and the chamber mapping files keep
+their real shape, since they grow by two chambers every three years.
+Generation is seeded, so the same scale always produces the same files.
+
+Usage:
+    python synthetic_data.py <output dir>              # Scale 1
+    python synthetic_data.py <output dir> --scale 100  # 100x committees and people
+"""
+
+import argparse
+import json
+import logging
+import random
+from pathlib import Path
+from typing import Dict, List
+
+from loader import CHAMBER_MAPPING_FILES, ENTITY_DIRS
+
+logger = logging.getLogger(__name__)
+
+# Entities at scale 1, matching the size of the real dataset
+BASE_COUNTS = {
+    "committee": 200,
+    "person": 1134,
+}
+
+FIRST_CONGRESS = 8
+LAST_CONGRESS = 20
+FIRST_CONGRESS_YEAR = 1987
+
+CROCKFORD_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+# Bumped whenever generated trees change shape, so cached trees are regenerated
+GENERATOR_VERSION = 2
+
+FIRST_NAMES = ["Maria", "Jose", "Juan", "Ana", "Ramon", "Teresa", "Miguel", "Rosa",
+               "Antonio", "Carmen", "Francisco", "Luz", "Eduardo", "Gloria", "Manuel"]
+LAST_NAMES = ["Santos", "Reyes", "Cruz", "Bautista", "Garcia", "Mendoza", "Torres",
+              "Villanueva", "Ramos", "Aquino", "Castillo", "Flores", "Gonzales", "Navarro"]
+SUFFIXES = ["Jr.", "Sr.", "III"]
+COMMITTEE_TOPICS = ["Agriculture", "Appropriations", "Education", "Energy", "Finance",
+                    "Health", "Justice", "Labor", "Public Works", "Tourism", "Ways and Means"]
+
+
+def _ulid(rng: random.Random) -> str:
+    """A random, valid ULID (Crockford base32, 26 characters).
+
+    The first character is at most 7, since the 48-bit timestamp it starts
+    with would overflow otherwise.
+    """
+    return rng.choice(CROCKFORD_ALPHABET[:8]) + "".join(rng.choice(CROCKFORD_ALPHABET) for _ in range(25))
+
+
+def _ordinal(number: int) -> str:
+    if 10 <= number % 100 <= 20:
+        return f"{number}th"
+    return f"{number}{ {1: 'st', 2: 'nd', 3: 'rd'}.get(number % 10, 'th') }"
+
+
+def _toml_value(value) -> str:
+    """Render a string, int or list of them as TOML."""
+    if isinstance(value, list):
+        return "[ " + ", ".join(_toml_value(item) for item in value) + ",]"
+    if isinstance(value, int):
+        return str(value)
+    # JSON string escapes are valid TOML basic-string escapes
+    return json.dumps(value, ensure_ascii=False)
+
+
+def to_toml(record: dict) -> str:
+    """Render a record in the layout of the data files (memberships as [[memberships]])."""
+    lines = [f"{key} = {_toml_value(value)}" for key, value in record.items() if key != "memberships"]
+    for membership in record.get("memberships", []):
+        lines.append("")
+        lines.append("[[memberships]]")
+        lines.extend(f"{key} = {_toml_value(value)}" for key, value in membership.items())
+    return "\n".join(lines) + "\n"
+
+
+def _write_records(data_dir: Path, entity: str, records: List[dict]):
+    entity_dir = data_dir / ENTITY_DIRS[entity]
+    entity_dir.mkdir(parents=True, exist_ok=True)
+    for record in records:
+        (entity_dir / f"{record['id']}.toml").write_text(to_toml(record), encoding="utf-8")
+
+
+def generate_congresses(rng: random.Random) -> List[dict]:
+    congresses = []
+    for number in range(FIRST_CONGRESS, LAST_CONGRESS + 1):
+        start_year = FIRST_CONGRESS_YEAR + 3 * (number - FIRST_CONGRESS)
+        congresses.append({
+            "id": _ulid(rng),
+            "congress_number": number,
+            "congress_website_key": number,
+            "ordinal": _ordinal(number),
+            "name": f"{_ordinal(number)} Congress of the Philippines",
+            "start_date": f"{start_year}-07-27",
+            "start_year": start_year,
+            "end_date": f"{start_year + 3}-06-09",
+            "end_year": start_year + 3,
+            "year_range": f"{start_year}-{start_year + 3}",
+        })
+    return congresses
+
+
+def generate_chambers(rng: random.Random) -> List[dict]:
+    return [
+        {
+            "id": _ulid(rng),
+            "name": f"{'Senate' if subtype == 'senate' else 'House of Representatives'} - "
+                    f"{_ordinal(number)} Congress",
+            "type": "chamber",
+            "subtype": subtype,
+            "congress": number,
+        }
+        for number in range(FIRST_CONGRESS, LAST_CONGRESS + 1)
+        for subtype in ["senate", "house"]
+    ]
+
+
+def generate_committees(rng: random.Random, count: int) -> List[dict]:
+    committees = []
+    for index in range(count):
+        first = rng.randint(FIRST_CONGRESS, LAST_CONGRESS)
+        last = rng.randint(first, min(LAST_CONGRESS, first + 4))
+        committees.append({
+            "id": _ulid(rng),
+            "senate_website_keys": [f"C{index:06d}"],
+            "name": f"{rng.choice(COMMITTEE_TOPICS)} Committee {index}",
+            "type": "regular",
+            "congresses": list(range(first, last + 1)),
+        })
+    return committees
+
+
+def generate_persons(rng: random.Random, count: int) -> List[dict]:
+    persons = []
+    for index in range(count):
+        person = {"id": _ulid(rng)}
+        subtype = "senate" if rng.random() < 0.1 else "house"
+        if subtype == "senate":
+            person["senate_website_keys"] = [f"S{index:06d}"]
+        person["congress_website_primary_keys"] = [index + 1]
+        person["congress_website_author_keys"] = [f"A{index:06d}"]
+        person["last_name"] = rng.choice(LAST_NAMES)
+        person["first_name"] = rng.choice(FIRST_NAMES)
+        person["middle_name"] = rng.choice(LAST_NAMES)
+        if rng.random() < 0.1:
+            person["name_suffix"] = rng.choice(SUFFIXES)
+
+        # Consecutive terms, occasionally moving between chambers
+        first = rng.randint(FIRST_CONGRESS, LAST_CONGRESS)
+        memberships = []
+        for congress in range(first, min(LAST_CONGRESS, first + rng.randint(0, 4)) + 1):
+            if rng.random() < 0.05:
+                subtype = "senate" if subtype == "house" else "house"
+            memberships.append({"type": "chamber", "congress": congress, "subtype": subtype})
+        person["memberships"] = memberships
+        persons.append(person)
+    return persons
+
+
+def generate_tree(data_dir: Path, scale: int = 1, seed: int = 0) -> Dict[str, int]:
+    """Write a synthetic data tree; returns the number of files per entity type."""
+    rng = random.Random(seed)
+    records = {
+        "congress": generate_congresses(rng),
+        "chamber": generate_chambers(rng),
+        "committee": generate_committees(rng, BASE_COUNTS["committee"] * scale),
+        "person": generate_persons(rng, BASE_COUNTS["person"] * scale),
+    }
+    for entity, entity_records in records.items():
+        _write_records(data_dir, entity, entity_records)
+
+    chambers_dir = data_dir / ENTITY_DIRS["chamber"]
+    for subtype, file_name in CHAMBER_MAPPING_FILES.items():
+        lines = [f"{c['congress']}: {c['id']}" for c in records["chamber"] if c["subtype"] == subtype]
+        (chambers_dir / file_name).write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    return {entity: len(entity_records) for entity, entity_records in records.items()}
+
+
+def main():
+    """Generate a synthetic data tree."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    parser = argparse.ArgumentParser(description="Generate a synthetic data/ tree for benchmarks.")
+    parser.add_argument("output", type=Path, help="Directory to write the tree to")
+    parser.add_argument("--scale", type=int, default=1, help="Multiplier for committees and people")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    args = parser.parse_args()
+
+    counts = generate_tree(args.output, scale=args.scale, seed=args.seed)
+    logger.info(f"Wrote {sum(counts.values())} files to {args.output}: {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Record preparation shared by every sync target and exporter.
+
+Turns loaded TOML records into the node property maps and relationship rows
+that end up in the graph, so the Neo4j sync and the offline exports agree on
+exactly what is written.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from loader import flatten_memberships
+
+# Chamber subtypes with a `<subtype>_terms` count on Person nodes
+TERM_SUBTYPES = ["senate", "house"]
+
+
+def full_name(person: dict, prefix: bool = True) -> str:
+    """Build a display name from a person's name parts (optionally without the prefix)."""
+    parts = [
+        person.get("name_prefix") if prefix else None,
+        person.get("first_name"),
+        person.get("middle_name"),
+        person.get("last_name"),
+        person.get("name_suffix"),
+    ]
+    return " ".join(str(part).strip() for part in parts if part and str(part).strip())
+
+
+def name_key(name: str) -> str:
+    """Normalise a name for case-insensitive lookups."""
+    return " ".join(str(name).split()).casefold()
+
+
+def congress_node(congress: dict) -> dict:
+    """Properties of a Congress node."""
+    return dict(congress)
+
+
+def chamber_node(chamber: dict) -> dict:
+    """Properties of a chamber Group node."""
+    return dict(chamber)
+
+
+def chamber_congress_edge(chamber: dict, congress_mapping: Dict[int, str]) -> Optional[dict]:
+    """The (Group)-[:BELONGS_TO]->(Congress) row of a chamber, if its congress exists."""
+    if chamber.get("congress") and chamber["congress"] in congress_mapping:
+        return {"chamber_id": chamber["id"], "congress_id": congress_mapping[chamber["congress"]]}
+    return None
+
+
+def committee_node(committee: dict) -> dict:
+    """Properties of a Committee node (everything but the `congresses` array)."""
+    return {k: v for k, v in committee.items() if k != "congresses"}
+
+
+def committee_congress_edges(committee: dict, congress_mapping: Dict[int, str]) -> List[dict]:
+    """(Committee)-[:BELONGS_TO]->(Congress) rows for the committee's known congresses.
+
+    A congress listed twice yields one row, as the graph has one edge for it.
+    """
+    return [
+        {"committee_id": committee["id"], "congress_id": congress_mapping[congress_num]}
+        for congress_num in dict.fromkeys(committee.get("congresses", []))
+        if congress_num in congress_mapping
+    ]
+
+
+def person_career(person: dict) -> dict:
+    """Career aggregates of a person, from their chamber memberships.
+
+    `senate_terms` and `house_terms` count the congresses served in each
+    chamber. `congresses_served` lists the congress numbers in order; it and
+    `first_congress`/`last_congress` are left out for people without memberships.
+    """
+    terms = {subtype: set() for subtype in TERM_SUBTYPES}
+    for membership in person.get("memberships", []):
+        if membership.get("type") == "chamber" and membership.get("congress") \
+                and membership.get("subtype") in terms:
+            terms[membership["subtype"]].add(membership["congress"])
+
+    congresses = sorted(set().union(*terms.values()))
+    career = {f"{subtype}_terms": len(terms[subtype]) for subtype in TERM_SUBTYPES}
+    if congresses:
+        career["congresses_served"] = congresses
+        career["first_congress"] = congresses[0]
+        career["last_congress"] = congresses[-1]
+    return career
+
+
+def person_node(person: dict) -> dict:
+    """Properties of a Person node.
+
+    Everything but memberships and congresses, plus derived properties so
+    listings don't need to rebuild them: `full_name`, a lowercase `name_key`
+    for search, and the career aggregates of `person_career`. The key leaves
+    out the name prefix, so searching by first name also finds "Atty" people.
+    """
+    node = {k: v for k, v in person.items() if k not in ["memberships", "congresses"]}
+    name = full_name(person)
+    if name:
+        node["full_name"] = name
+    search_name = full_name(person, prefix=False)
+    if search_name:
+        node["name_key"] = name_key(search_name)
+    node.update(person_career(person))
+    return node
+
+
+def person_chamber_edges(person: dict,
+                         chamber_mapping: Dict[Tuple[int, str], str]) -> Tuple[List[dict], int]:
+    """(Person)-[:MEMBER_OF {position}]->(Group) rows for a person's chamber memberships.
+
+    Returns the rows and the number of chamber memberships whose chamber is
+    not in `chamber_mapping`. Several memberships of one chamber (e.g. a
+    position change within a congress) become one row with the last position,
+    as the sync MERGEs a single edge per person and chamber.
+    """
+    edges = {}
+    unresolved = 0
+    for membership in flatten_memberships(person):
+        if membership["type"] != "chamber" or not membership["congress"] or not membership["subtype"]:
+            continue
+        chamber_id = chamber_mapping.get((membership["congress"], membership["subtype"]))
+        if chamber_id is None:
+            unresolved += 1
+            continue
+        edges[chamber_id] = {
+            "person_id": person["id"],
+            "chamber_id": chamber_id,
+            "position": membership["position"]
+        }
+    return list(edges.values()), unresolved
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Referential-integrity checks for the data directory.
+
+Parses every entity file once and checks, in a single pass over the records:
+
+- every file parses and has an `id` that is a well-formed ULID matching its
+  file name, and no id is used twice
+- congress numbers and chambers ((congress, subtype) pairs) are unique
+- chamber `congress` and committee `congresses` values refer to existing congresses
+- every person chamber membership has a congress and subtype, and a chamber file
+- the chamber mapping files agree with the chamber files, and list every chamber
+- no senate/website key is shared by two people (a warning: the graph is
+  still consistent, but lookups by that key are ambiguous)
+
+The sync runs these checks before touching the database, so a bad commit
+fails fast instead of leaving a half-written graph.
+
+Usage:
+    python validate_data.py                         # Print problems; exit 1 if there are errors
+    python validate_data.py --strict                # Exit 1 on warnings too
+    python validate_data.py --report report.json    # Also write a machine-readable report
+"""
+
+import argparse
+import json
+import logging
+import re
+import sys
+from collections import Counter, defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from loader import CHAMBER_MAPPING_FILES, ENTITY_DIRS, list_entity_files, load_chamber_mapping, parse_files
+
+logger = logging.getLogger(__name__)
+
+# Crockford base32, 48-bit timestamp first (so the first character is at most 7)
+ULID_PATTERN = re.compile(r"^[0-7][0-9A-HJKMNP-TV-Z]{25}$")
+
+# Person keys that identify one person on the congress and senate websites
+PERSON_EXTERNAL_KEYS = [
+    "senate_website_keys",
+    "congress_website_primary_keys",
+    "congress_website_author_keys",
+]
+
+# Checks that are reported but don't make the data invalid
+WARNING_CHECKS = {"duplicate_external_key"}
+
+
+@dataclass
+class Problem:
+    """One failed check."""
+
+    check: str
+    message: str
+    file: Optional[str] = None
+    id: Optional[str] = None
+    severity: str = "error"
+
+
+@dataclass
+class ValidationReport:
+    """Outcome of validating the data directory."""
+
+    files: int = 0
+    problems: List[Problem] = field(default_factory=list)
+
+    @property
+    def errors(self) -> List[Problem]:
+        return [problem for problem in self.problems if problem.severity == "error"]
+
+    @property
+    def warnings(self) -> List[Problem]:
+        return [problem for problem in self.problems if problem.severity == "warning"]
+
+    @property
+    def valid(self) -> bool:
+        return not self.errors
+
+    def add(self, check: str, message: str, file: Optional[str] = None, entity_id: Optional[str] = None):
+        severity = "warning" if check in WARNING_CHECKS else "error"
+        self.problems.append(Problem(check=check, message=message, file=file, id=entity_id, severity=severity))
+
+    def to_dict(self) -> dict:
+        return {
+            "valid": self.valid,
+            "files": self.files,
+            "errors": len(self.errors),
+            "warnings": len(self.warnings),
+            "counts": dict(Counter(problem.check for problem in self.problems)),
+            "problems": [asdict(problem) for problem in self.problems],
+        }
+
+
+def validate(data_dir: Path, workers: Optional[int] = None) -> ValidationReport:
+    """Parse every entity file and run all checks."""
+    report = ValidationReport()
+    root = data_dir.parent
+
+    def rel(path: Path) -> str:
+        return str(path.relative_to(root)) if path.is_relative_to(root) else str(path)
+
+    # One parse of every file, remembering which entity type and file each record came from
+    entity_files = [(entity, path) for entity in ENTITY_DIRS for path in list_entity_files(data_dir, entity)]
+    report.files = len(entity_files)
+    records: Dict[str, List[Tuple[str, dict]]] = {entity: [] for entity in ENTITY_DIRS}
+    files_by_id: Dict[str, List[str]] = defaultdict(list)
+
+    parsed = parse_files([path for _, path in entity_files], workers=workers)
+    for (entity, _), (file_path, data, error) in zip(entity_files, parsed):
+        source = rel(file_path)
+        if error is not None:
+            report.add("parse_error", error, file=source)
+            continue
+        entity_id = data.get("id")
+        if not isinstance(entity_id, str) or not entity_id:
+            report.add("missing_id", "File has no string `id`", file=source)
+            continue
+        if not ULID_PATTERN.match(entity_id):
+            report.add("invalid_ulid", f"`{entity_id}` is not a ULID", file=source, entity_id=entity_id)
+        if file_path.stem != entity_id:
+            report.add("filename_mismatch", f"File name does not match id `{entity_id}`",
+                       file=source, entity_id=entity_id)
+        files_by_id[entity_id].append(source)
+        records[entity].append((source, data))
+
+    for entity_id, sources in files_by_id.items():
+        if len(sources) > 1:
+            report.add("duplicate_id", f"Id used by {len(sources)} files: {', '.join(sources)}",
+                       file=sources[0], entity_id=entity_id)
+
+    # Congress numbers
+    congress_numbers = {}
+    for source, congress in records["congress"]:
+        number = congress.get("congress_number")
+        if number in congress_numbers:
+            report.add("duplicate_congress", f"Congress {number} is also defined in {congress_numbers[number]}",
+                       file=source, entity_id=congress["id"])
+        else:
+            congress_numbers[number] = source
+
+    # Chambers
+    chambers = {}
+    for source, chamber in records["chamber"]:
+        number, subtype = chamber.get("congress"), chamber.get("subtype")
+        if number not in congress_numbers:
+            report.add("unknown_congress", f"Chamber refers to congress {number}, which has no file",
+                       file=source, entity_id=chamber["id"])
+        key = (number, subtype)
+        if key in chambers:
+            report.add("duplicate_chamber", f"{subtype} chamber of congress {number} is also defined in "
+                       f"{chambers[key][0]}", file=source, entity_id=chamber["id"])
+        else:
+            chambers[key] = (source, chamber["id"])
+
+    chamber_mapping = load_chamber_mapping(data_dir)
+    for (number, subtype), chamber_id in sorted(chamber_mapping.items()):
+        _, file_chamber_id = chambers.get((number, subtype), (None, None))
+        if file_chamber_id != chamber_id:
+            mapping_file = data_dir / ENTITY_DIRS["chamber"] / CHAMBER_MAPPING_FILES[subtype]
+            report.add("chamber_mapping_mismatch",
+                       f"Maps congress {number} to {chamber_id}, but the chamber file has {file_chamber_id}",
+                       file=rel(mapping_file), entity_id=chamber_id)
+    for (number, subtype), (source, chamber_id) in sorted(chambers.items(), key=lambda item: item[1]):
+        if subtype in CHAMBER_MAPPING_FILES and (number, subtype) not in chamber_mapping:
+            report.add("chamber_mapping_missing",
+                       f"{subtype} chamber of congress {number} is missing from {CHAMBER_MAPPING_FILES[subtype]}",
+                       file=source, entity_id=chamber_id)
+
+    # Committees
+    for source, committee in records["committee"]:
+        for number in committee.get("congresses", []):
+            if number not in congress_numbers:
+                report.add("unknown_congress", f"Committee refers to congress {number}, which has no file",
+                           file=source, entity_id=committee["id"])
+
+    # People: memberships and external keys
+    key_owners: Dict[Tuple[str, object], List[str]] = defaultdict(list)
+    for source, person in records["person"]:
+        for membership in person.get("memberships", []):
+            if membership.get("type") != "chamber":
+                continue
+            number, subtype = membership.get("congress"), membership.get("subtype")
+            if not number or not subtype:
+                report.add("incomplete_membership", "Chamber membership needs both `congress` and `subtype`",
+                           file=source, entity_id=person["id"])
+            elif (number, subtype) not in chambers:
+                report.add("unknown_chamber", f"Membership refers to the {subtype} chamber of congress "
+                           f"{number}, which has no file", file=source, entity_id=person["id"])
+        for key_name in PERSON_EXTERNAL_KEYS:
+            for value in set(person.get(key_name, [])):
+                key_owners[(key_name, value)].append(person["id"])
+
+    for (key_name, value), owners in key_owners.items():
+        if len(owners) > 1:
+            report.add("duplicate_external_key", f"{key_name} `{value}` is shared by {', '.join(owners)}",
+                       entity_id=owners[0])
+
+    return report
+
+
+def log_report(report: ValidationReport, limit: int = 50):
+    """Log a summary of the report and the first `limit` errors and warnings."""
+    if not report.problems:
+        logger.info(f"Validated {report.files} files: no problems found")
+        return
+    counts = ", ".join(f"{count} {check}" for check, count in report.to_dict()["counts"].items())
+    log = logger.error if report.errors else logger.warning
+    log(f"Validated {report.files} files: {len(report.errors)} errors, "
+        f"{len(report.warnings)} warnings ({counts})")
+    for problems, log in [(report.errors, logger.error), (report.warnings, logger.warning)]:
+        for problem in problems[:limit]:
+            location = problem.file or problem.id or ""
+            log(f"  - [{problem.check}] {location}: {problem.message}")
+        if len(problems) > limit:
+            log(f"  ... and {len(problems) - limit} more")
+
+
+def main():
+    """Validate the data directory."""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    parser = argparse.ArgumentParser(description="Check the data directory for broken references.")
+    parser.add_argument("--report", type=Path, help="Write the full report as JSON")
+    parser.add_argument("--strict", action="store_true", help="Treat warnings as errors")
+    args = parser.parse_args()
+
+    data_dir = Path(__file__).parent.parent / "data"
+    report = validate(data_dir)
+    log_report(report)
+    if args.report:
+        args.report.write_text(json.dumps(report.to_dict(), indent=2) + "\n", encoding="utf-8")
+        logger.info(f"Wrote report to {args.report}")
+    if not report.valid or (args.strict and report.warnings):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
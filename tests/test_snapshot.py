@@ -0,0 +1,42 @@
+import struct
+
+import pytest
+
+from snapshot import MAGIC, Snapshot, load_dataset_cached, open_snapshot
+
+
+@pytest.mark.parametrize("content", [
+    b"",
+    b"this is not a snapshot file at all",
+    MAGIC,
+    MAGIC + b"\x01\x02",
+    MAGIC + struct.pack("<Q", 1000) + b'{"version": 1, "fi',
+    MAGIC + struct.pack("<Q", 2) + b"[]",
+], ids=["empty", "garbage", "magic only", "truncated length", "truncated header", "not an object"])
+def test_open_snapshot_ignores_corrupt_file(tmp_path, content):
+    path = tmp_path / "snapshot.bin"
+    path.write_bytes(content)
+    assert open_snapshot(path) is None
+
+
+def test_corrupt_snapshot_raises_value_error(tmp_path):
+    path = tmp_path / "snapshot.bin"
+    path.write_bytes(b"garbage garbage garbage")
+    with pytest.raises(ValueError):
+        Snapshot(path)
+
+
+def test_corrupt_snapshot_is_rebuilt(tmp_path):
+    data_dir = tmp_path / "data"
+    (data_dir / "congress").mkdir(parents=True)
+    (data_dir / "congress" / "01K5S4AG1AJZ79AMDYG4MFHE7E.toml").write_text(
+        'id = "01K5S4AG1AJZ79AMDYG4MFHE7E"\ncongress_number = 8\n', encoding="utf-8"
+    )
+    path = tmp_path / "snapshot.bin"
+    path.write_bytes(MAGIC + b"\x00")
+
+    dataset = load_dataset_cached(data_dir, path, workers=1)
+
+    assert [c["congress_number"] for c in dataset.congresses] == [8]
+    with Snapshot(path) as snapshot:
+        assert snapshot.row_count("congresses") == 1
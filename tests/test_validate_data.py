@@ -0,0 +1,44 @@
+from loader import CHAMBER_MAPPING_FILES, ENTITY_DIRS
+from validate_data import validate
+
+CONGRESS_ID = "01K5S4AG1AJZ79AMDYG4MFHE7E"
+SENATE_ID = "01K64ECAES8JBV2Y5HR437SBSX"
+HOUSE_ID = "01K64ECAETF9923DENHPM8G71S"
+
+
+def write_tree(data_dir, senate_mapping, house_mapping):
+    """A congress with a senate and a house chamber, and the given mapping file contents."""
+    congress_dir = data_dir / ENTITY_DIRS["congress"]
+    chamber_dir = data_dir / ENTITY_DIRS["chamber"]
+    congress_dir.mkdir(parents=True)
+    chamber_dir.mkdir(parents=True)
+    (congress_dir / f"{CONGRESS_ID}.toml").write_text(
+        f'id = "{CONGRESS_ID}"\ncongress_number = 8\n', encoding="utf-8"
+    )
+    for chamber_id, subtype in [(SENATE_ID, "senate"), (HOUSE_ID, "house")]:
+        (chamber_dir / f"{chamber_id}.toml").write_text(
+            f'id = "{chamber_id}"\ntype = "chamber"\nsubtype = "{subtype}"\ncongress = 8\n', encoding="utf-8"
+        )
+    (chamber_dir / CHAMBER_MAPPING_FILES["senate"]).write_text(senate_mapping, encoding="utf-8")
+    (chamber_dir / CHAMBER_MAPPING_FILES["house"]).write_text(house_mapping, encoding="utf-8")
+
+
+def test_complete_chamber_mapping_is_valid(tmp_path):
+    data_dir = tmp_path / "data"
+    write_tree(data_dir, f"8: {SENATE_ID}\n", f"8: {HOUSE_ID}\n")
+
+    report = validate(data_dir, workers=1)
+
+    assert report.problems == []
+
+
+def test_chamber_missing_from_mapping_is_an_error(tmp_path):
+    data_dir = tmp_path / "data"
+    write_tree(data_dir, f"8: {SENATE_ID}\n", "")
+
+    report = validate(data_dir, workers=1)
+
+    assert not report.valid
+    assert [(problem.check, problem.id) for problem in report.problems] == [
+        ("chamber_mapping_missing", HOUSE_ID)
+    ]